@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+"""Butterworth (filtfilt + hilbert) vs FFT-domain octave filterbank.
+
+  python benchmarks/bench_filterbank.py --n 10000000 --bands 8 10 12
+"""
+import argparse, json, time
+import numpy as np
+from mpfst.spectral.utils import octave_band_edges, filterbank_energy
+
+ap = argparse.ArgumentParser()
+ap.add_argument("--n", type=float, default=1e7)
+ap.add_argument("--fs", type=float, default=1000.0)
+ap.add_argument("--fmin", type=float, default=0.1)
+ap.add_argument("--bands", type=int, nargs="+", default=[8, 10, 12])
+ap.add_argument("--backends", nargs="+", default=["butter", "fft"])
+args = ap.parse_args()
+
+x = np.cumsum(np.random.default_rng(0).standard_normal(int(args.n)))
+x -= np.linspace(x[0], x[-1], len(x))
+for nb in args.bands:
+    edges = octave_band_edges(args.fmin, args.fs/2, nb)
+    row = {"n": len(x), "bands": len(edges)-1}
+    for be in args.backends:
+        t0 = time.perf_counter()
+        E = filterbank_energy(x, args.fs, edges, backend=be)
+        row[be+"_s"] = round(time.perf_counter()-t0, 3)
+        del E
+    print(json.dumps(row))
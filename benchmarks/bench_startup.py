@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Cold-start cost of `mpfst` subcommands from `python -X importtime`.
+
+  python benchmarks/bench_startup.py --repeat 5 --budget-ms 100
+
+Per subcommand prints the summed top-level import time, the heaviest imports
+and wall time (median of --repeat runs). Exits 1 if the `vbk` import total
+exceeds --budget-ms.
+"""
+import argparse, json, os, statistics, subprocess, sys, tempfile, time
+
+def _csv():
+    import numpy as np
+    path = os.path.join(tempfile.mkdtemp(), "x.csv")
+    x = np.random.default_rng(0).standard_normal(4096)
+    np.savetxt(path, x, header="x", comments="")
+    return path
+
+def commands(csv):
+    return {
+        "vbk": ["vbk", "--M", "1", "--a", "0.9", "--mu", "0.05"],
+        "superradiance": ["superradiance", "--M", "1", "--a", "0.9", "--mu", "0.05"],
+        "invert": ["invert", "--mu", "1.5", "--gamma", "1.0"],
+        "meter": ["meter", "--csv", csv, "--fs", "256"],
+        "jumps": ["jumps", "--csv", csv, "--fs", "256", "--fmin", "2", "--fmax", "100", "--backend", "fft"],
+    }
+
+def importtime(args):
+    """(top-level import total in ms, [(cumulative ms, module)] of the top-level imports, wall s)."""
+    t0 = time.perf_counter()
+    p = subprocess.run([sys.executable, "-X", "importtime", "-m", "mpfst.cli"] + args,
+                       capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - t0
+    top = []
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line: continue
+        _, cum, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):   # indentation marks nested imports
+            top.append((int(cum)/1000, name.strip()))
+    return sum(c for c, _ in top), sorted(top, reverse=True), wall
+
+ap = argparse.ArgumentParser()
+ap.add_argument("--commands", nargs="+", default=None)
+ap.add_argument("--repeat", type=int, default=3)
+ap.add_argument("--budget-ms", type=float, default=100.0, help="Import-time budget for `vbk`")
+args = ap.parse_args()
+
+cmds = commands(_csv())
+over = False
+for name in args.commands or list(cmds):
+    runs = [importtime(cmds[name]) for _ in range(args.repeat)]
+    total = statistics.median(r[0] for r in runs)
+    print(json.dumps({"command": name, "import_ms": round(total, 1),
+                      "wall_ms": round(1000*statistics.median(r[2] for r in runs), 1),
+                      "heaviest": [[m, round(c, 1)] for c, m in runs[0][1][:3]]}))
+    if name=="vbk" and total > args.budget_ms: over = True
+sys.exit(1 if over else 0)
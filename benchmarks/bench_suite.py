@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""Wall time and peak memory of the analysis hot paths on synthetic signals.
+
+  python benchmarks/bench_suite.py --tiers 1e3 1e4 1e5 1e6 --out bench.json
+  python benchmarks/bench_suite.py --tiers 1e3 1e4 1e5 1e6 --compare bench.json
+
+Signals are deterministic (seed 0): `pink` (1/f noise by spectral shaping),
+`doubling` (logistic map at the period-doubling accumulation point plus a
+little noise) and `pareto` (random walk with symmetric Pareto, α=1.5,
+increments). Each case runs on its signal for every size tier up to its own
+cap; a tier is skipped once the previous one, scaled by the size ratio, would
+exceed --budget-s. `ci_mean_loop` is the former per-resample ci_mean; the
+`ci_mean` and `ci_mean_workers` rows at the same size carry `speedup_vs_loop`. Time is the median of --repeat runs; peak memory is
+measured by tracemalloc in a separate run. The on-disk cache is disabled.
+
+With --compare the results are checked against a baseline JSON written by
+--out: a case regresses when its time exceeds baseline·(1+--tolerance) and
+baseline + --min-delta-s, or its peak memory exceeds baseline·(1+--tolerance).
+Regressions are listed and the exit status is 1.
+"""
+import argparse, json, os, platform, statistics, sys, time, tracemalloc, warnings
+import numpy as np
+
+FS = 1000.0
+
+def pink(n, rng):
+    f = np.fft.rfftfreq(n, 1/FS)
+    X = np.fft.rfft(rng.standard_normal(n))
+    X[1:] /= np.sqrt(f[1:]); X[0] = 0
+    return np.fft.irfft(X, n)
+
+def doubling(n, rng, r=3.5699456):
+    x = np.empty(n); v = 0.4
+    for i in range(min(n, 1 << 16)): v = r*v*(1-v); x[i] = v
+    x[1 << 16:] = np.resize(x[:1 << 16], n - min(n, 1 << 16))   # the orbit is (quasi-)periodic
+    return x - 0.5 + 0.01*rng.standard_normal(n)
+
+def pareto(n, rng, alpha=1.5):
+    return np.cumsum(rng.choice([-1.0, 1.0], n) * (rng.pareto(alpha, n) + 1))
+
+SIGNALS = {"pink": pink, "doubling": doubling, "pareto": pareto}
+
+def _gate(x):
+    from mpfst.domains.gw_superradiance import gate_grid
+    u = (x - x.min()) / (np.ptp(x) + 1e-12)
+    return gate_grid(M=10 + 50*u, a=(10 + 50*u)*0.99*u, mu=0.05)
+
+def _granger(x):
+    from mpfst.causality.granger import granger_pair
+    y = np.roll(x, 1) + 0.5*np.random.default_rng(1).standard_normal(len(x))
+    return granger_pair(x, y, maxlag=5)
+
+def _ci_mean_loop(x, n_boot=200, seed=0):
+    """The former list-comprehension ci_mean, kept as the speedup reference."""
+    rng = np.random.default_rng(seed)
+    bs = [rng.choice(x, size=len(x), replace=True).mean() for _ in range(n_boot)]
+    return np.quantile(bs, [0.025, 0.975])
+
+def _cases():
+    """name -> (signal, max n, fn(x))."""
+    from mpfst.coherence.metrics import hurst_dfa, spectral_slope_gamma, heavy_tail_mu_hill
+    from mpfst.spectral.utils import octave_band_edges, filterbank_energy
+    from mpfst.spectral.octave_jump import detect_shell_jumps_series
+    from mpfst.nulls.phase_randomize import phase_randomize
+    from mpfst.stats.bootstrap import ci_mean
+    edges = octave_band_edges(6.25, 400.0, 6)
+    return {
+        "hurst_dfa": ("pink", 10**7, lambda x: hurst_dfa(x)),
+        "spectral_slope_gamma": ("pink", 10**7, lambda x: spectral_slope_gamma(x, fs=FS)),
+        "heavy_tail_mu_hill": ("pareto", 10**7, lambda x: heavy_tail_mu_hill(np.diff(x))),
+        "filterbank_energy_butter": ("pink", 10**7, lambda x: filterbank_energy(x, FS, edges, backend="butter")),
+        "filterbank_energy_fft": ("pink", 10**7, lambda x: filterbank_energy(x, FS, edges, backend="fft")),
+        "detect_shell_jumps_series": ("doubling", 10**7, lambda x: detect_shell_jumps_series(
+            x, FS, 6.25, 400.0, n_bands=6, backend="fft", frame=256)),
+        "phase_randomize": ("pink", 10**7, lambda x: phase_randomize(x, seed=0)),
+        "ci_mean": ("pareto", 10**6, lambda x: ci_mean(x, n_boot=200, seed=0)),
+        "ci_mean_workers": ("pareto", 10**6, lambda x: ci_mean(x, n_boot=200, seed=0, workers=os.cpu_count())),
+        "ci_mean_loop": ("pareto", 10**6, _ci_mean_loop),
+        "granger_pair": ("pink", 10**6, _granger),
+        "superradiance_gate": ("pareto", 10**7, _gate),
+    }
+
+def _time(fn, x, repeat):
+    ts = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); fn(x); ts.append(time.perf_counter() - t0)
+    return statistics.median(ts)
+
+def _peak(fn, x):
+    tracemalloc.start()
+    try:
+        fn(x); return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _bench(table, name, tiers, repeat, budget_s, memory):
+    kind, cap, fn = table[name]
+    rows, prev = [], None
+    for n in sorted(tiers):
+        if n > cap: break
+        if prev and prev[1] * n / prev[0] > budget_s:
+            print(json.dumps({"case": name, "n": n, "skipped": "budget"}), file=sys.stderr); break
+        x = SIGNALS[kind](n, np.random.default_rng(0))
+        fn(x)   # warm-up: imports, FFT plans
+        row = {"case": name, "signal": kind, "n": n, "seconds": _time(fn, x, repeat)}
+        if memory: row["peak_mb"] = _peak(fn, x) / 2**20
+        rows.append(row); prev = (n, row["seconds"])
+        print(json.dumps(row), file=sys.stderr)
+    return rows
+
+def run(tiers, cases=None, repeat=3, budget_s=60.0, memory=True):
+    from mpfst import cache, __version__
+    cache.disable()
+    table = _cases()
+    rows = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")   # short-signal warnings (e.g. Welch nperseg) at the small tiers
+        for name in cases or list(table): rows += _bench(table, name, tiers, repeat, budget_s, memory)
+    loop = {r["n"]: r["seconds"] for r in rows if r["case"]=="ci_mean_loop"}
+    for r in rows:
+        if r["case"] in ("ci_mean", "ci_mean_workers") and r["n"] in loop:
+            r["speedup_vs_loop"] = loop[r["n"]] / r["seconds"]
+    meta = {"python": platform.python_version(), "numpy": np.__version__, "mpfst": __version__,
+            "machine": platform.machine(), "repeat": repeat}
+    return {"meta": meta, "results": rows}
+
+def compare(current, baseline, tolerance=0.25, min_delta_s=0.005):
+    """Regressions of `current` against `baseline` (both as written by --out)."""
+    base = {(r["case"], r["n"]): r for r in baseline["results"]}
+    out = []
+    for r in current["results"]:
+        b = base.get((r["case"], r["n"]))
+        if b is None: continue
+        if r["seconds"] > b["seconds"]*(1+tolerance) and r["seconds"] - b["seconds"] > min_delta_s:
+            out.append({"case": r["case"], "n": r["n"], "metric": "seconds", "baseline": b["seconds"],
+                        "current": r["seconds"], "ratio": r["seconds"]/b["seconds"]})
+        if "peak_mb" in r and "peak_mb" in b and r["peak_mb"] > b["peak_mb"]*(1+tolerance) + 1e-3:
+            out.append({"case": r["case"], "n": r["n"], "metric": "peak_mb", "baseline": b["peak_mb"],
+                        "current": r["peak_mb"], "ratio": r["peak_mb"]/max(b["peak_mb"], 1e-9)})
+    return out
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tiers", type=float, nargs="+", default=[1e3, 1e4, 1e5, 1e6])
+    ap.add_argument("--cases", nargs="+", default=None)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--budget-s", type=float, default=60.0, help="Skip tiers projected to take longer")
+    ap.add_argument("--no-memory", action="store_true")
+    ap.add_argument("--out", default=None, help="Write results JSON here")
+    ap.add_argument("--compare", default=None, help="Baseline JSON to check for regressions")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--min-delta-s", type=float, default=0.005, help="Ignore slowdowns smaller than this")
+    args = ap.parse_args()
+    res = run([int(t) for t in args.tiers], args.cases, args.repeat, args.budget_s, not args.no_memory)
+    if args.out:
+        with open(args.out, "w") as f: json.dump(res, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f: regressions = compare(res, json.load(f), args.tolerance, args.min_delta_s)
+        print(json.dumps({"regressions": regressions}, indent=2))
+        sys.exit(1 if regressions else 0)
+    if not args.out: print(json.dumps(res, indent=2))
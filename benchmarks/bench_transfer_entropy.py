@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+"""Runtime of the KSG transfer-entropy estimator vs sample size.
+
+  python benchmarks/bench_transfer_entropy.py --n 10000 30000 100000 --workers -1
+"""
+import argparse, json, time
+import numpy as np
+from mpfst.causality.transfer_entropy import transfer_entropy_ksg
+
+ap = argparse.ArgumentParser()
+ap.add_argument("--n", type=int, nargs="+", default=[10_000, 30_000, 100_000])
+ap.add_argument("--k", type=int, default=4)
+ap.add_argument("--dim", type=int, default=1, help="Embedding dimension (source and target)")
+ap.add_argument("--workers", type=int, default=-1)
+args = ap.parse_args()
+
+rng = np.random.default_rng(0)
+for n in args.n:
+    x = rng.standard_normal(n)
+    y = 0.8*np.roll(x, 1) + 0.3*rng.standard_normal(n)
+    t0 = time.perf_counter()
+    te = transfer_entropy_ksg(x, y, k=args.k, dim_x=args.dim, dim_y=args.dim, workers=args.workers)
+    print(json.dumps({"n": n, "k": args.k, "dim": args.dim, "workers": args.workers,
+                      "te": round(te, 4), "seconds": round(time.perf_counter()-t0, 3)}))
@@ -1,2 +1,9 @@
 __all__ = ["coherence","spectral","nulls","stats","dimension","causality","gating","fractional","domains"]
 __version__ = "0.1.0"
+
+def __getattr__(name):
+    # Subpackages load on first attribute access, keeping `import mpfst` cheap.
+    if name in __all__:
+        from importlib import import_module
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
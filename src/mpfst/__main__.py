@@ -0,0 +1,4 @@
+import sys
+from mpfst.cli import main
+
+sys.exit(main())
@@ -0,0 +1,175 @@
+"""Opt-in, content-addressed on-disk cache for expensive array functions.
+
+Off by default. Enable with `enable(path, max_bytes)` or the environment
+variables MPFST_CACHE_DIR / MPFST_CACHE_MAX_BYTES; `enable` also sets them, so
+worker processes started afterwards share the same cache.
+
+Keys are BLAKE2b digests of the function's qualified name, the package
+version and every bound argument (arrays by dtype, shape and raw bytes).
+Each entry is a directory of `.npy` files plus `meta.json`, written to a
+temporary name and renamed into place, so concurrent writers never expose a
+partial entry; hits are read back as ordinary writable arrays, the same type
+a miss returns. Entries are evicted least-recently-used once the cache
+exceeds its size bound.
+"""
+from __future__ import annotations
+import functools, hashlib, inspect, json, os, shutil, uuid
+from pathlib import Path
+import numpy as np
+
+ENV_DIR, ENV_MAX = "MPFST_CACHE_DIR", "MPFST_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 2**32
+_HASH_BLOCK = 1 << 24
+_stats = {"hits": 0, "misses": 0, "bypassed": 0, "stores": 0, "evictions": 0}
+
+class _Uncacheable(Exception):
+    pass
+
+def enable(path, max_bytes: int=DEFAULT_MAX_BYTES):
+    os.environ[ENV_DIR] = str(path); os.environ[ENV_MAX] = str(int(max_bytes))
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+def disable():
+    os.environ.pop(ENV_DIR, None); os.environ.pop(ENV_MAX, None)
+
+def cache_dir() -> Path|None:
+    p = os.environ.get(ENV_DIR)
+    return Path(p) if p else None
+
+def stats() -> dict:
+    """Hit/miss counters for this process plus the current on-disk size."""
+    root = cache_dir()
+    entries = list(_entries(root)) if root else []
+    return dict(_stats, entries=len(entries), bytes=sum(e[2] for e in entries))
+
+def clear():
+    root = cache_dir()
+    if root and root.exists(): shutil.rmtree(root, ignore_errors=True)
+    for k in _stats: _stats[k] = 0
+
+def _update(h, v):
+    if isinstance(v, np.ndarray):
+        h.update(f"nd{v.dtype.str}{v.shape}".encode())
+        if v.dtype.hasobject: raise _Uncacheable
+        flat = np.ascontiguousarray(v).reshape(-1).view(np.uint8)
+        for i in range(0, flat.size, _HASH_BLOCK): h.update(flat[i:i+_HASH_BLOCK])
+    elif v is None or isinstance(v, (bool, int, float, complex, str, bytes, np.generic, np.dtype)):
+        h.update(f"{type(v).__name__}:{v!r};".encode())
+    elif isinstance(v, list) and v and isinstance(v[0], (int, float, np.number)):
+        _update(h, np.asarray(v))
+    elif isinstance(v, type):
+        h.update(f"type:{v.__module__}.{v.__qualname__};".encode())
+    elif isinstance(v, (tuple, list)):
+        h.update(f"{type(v).__name__}[{len(v)}](".encode())
+        for item in v: _update(h, item)
+        h.update(b")")
+    elif isinstance(v, dict):
+        h.update(f"dict[{len(v)}](".encode())
+        for k in sorted(v, key=repr): _update(h, k); _update(h, v[k])
+        h.update(b")")
+    else:
+        raise _Uncacheable   # generators, callables, ... : no stable content key
+
+def _key(fn, bound) -> str:
+    from mpfst import __version__
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{fn.__module__}.{fn.__qualname__}@{__version__}".encode())
+    for name, v in bound.arguments.items():
+        h.update(name.encode()); _update(h, v)
+    return h.hexdigest()
+
+def _encode(v, d, files):
+    if isinstance(v, np.ndarray):
+        name = f"{len(files)}.npy"; files.append(name)
+        np.save(d/name, v); return {"npy": name}
+    if isinstance(v, tuple): return {"tuple": [_encode(i, d, files) for i in v]}
+    if isinstance(v, list): return {"list": [_encode(i, d, files) for i in v]}
+    if isinstance(v, dict) and all(isinstance(k, str) for k in v): return {"dict": {k: _encode(i, d, files) for k, i in v.items()}}
+    if isinstance(v, np.generic): v = v.item()
+    if v is None or isinstance(v, (bool, int, float, str)): return {"value": v}
+    raise _Uncacheable
+
+def _decode(m, d):
+    if "npy" in m: return np.load(d/m["npy"])
+    if "tuple" in m: return tuple(_decode(i, d) for i in m["tuple"])
+    if "list" in m: return [_decode(i, d) for i in m["list"]]
+    if "dict" in m: return {k: _decode(i, d) for k, i in m["dict"].items()}
+    return m["value"]
+
+def _entries(root):
+    """(path, last-use time, bytes) for each complete entry."""
+    if not root.exists(): return
+    for shard in os.scandir(root):
+        if not shard.is_dir(): continue
+        for e in os.scandir(shard.path):
+            if ".tmp-" in e.name: continue
+            try:
+                meta = os.stat(os.path.join(e.path, "meta.json"))
+                size = sum(f.stat().st_size for f in os.scandir(e.path))
+            except OSError:
+                continue   # removed concurrently
+            yield e.path, meta.st_mtime, size
+
+def _evict(root, max_bytes):
+    entries = sorted(_entries(root), key=lambda e: e[1])
+    total = sum(e[2] for e in entries)
+    for path, _, size in entries:
+        if total <= max_bytes: break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size; _stats["evictions"] += 1
+
+def _load(entry):
+    try:
+        meta = json.loads((entry/"meta.json").read_text())
+        out = _decode(meta, entry)
+        os.utime(entry/"meta.json")   # LRU: mark as recently used
+        return True, out
+    except (OSError, ValueError):
+        return False, None
+
+def _store(entry, result):
+    tmp = entry.parent / f"{entry.name}.tmp-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    tmp.mkdir(parents=True)
+    try:
+        meta = _encode(result, tmp, [])
+        (tmp/"meta.json").write_text(json.dumps(meta))
+        os.rename(tmp, entry)   # atomic; fails if another process stored it first
+        _stats["stores"] += 1
+    except (OSError, _Uncacheable):
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def memoize(fn=None, *, bypass=(), seeded=()):
+    """Cache `fn`'s results on disk while the cache is enabled.
+
+    Hits return writable in-memory arrays, as a miss does. Calls pass straight
+    through when an argument named in `bypass` is not None (e.g. an `out`
+    buffer), when one named in `seeded` is None or a Generator
+    (non-reproducible draws), or when any argument has no content key.
+    """
+    if fn is None: return functools.partial(memoize, bypass=bypass, seeded=seeded)
+    sig = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        root = cache_dir()
+        if root is None: return fn(*args, **kwargs)
+        bound = sig.bind(*args, **kwargs); bound.apply_defaults()
+        a = bound.arguments
+        if any(a.get(n) is not None for n in bypass) or \
+           any(a.get(n) is None or isinstance(a.get(n), (np.random.Generator, np.random.SeedSequence)) for n in seeded):
+            _stats["bypassed"] += 1; return fn(*args, **kwargs)
+        try:
+            key = _key(fn, bound)
+        except _Uncacheable:
+            _stats["bypassed"] += 1; return fn(*args, **kwargs)
+        entry = root / key[:2] / key
+        if entry.exists():
+            ok, out = _load(entry)
+            if ok:
+                _stats["hits"] += 1; return out
+        _stats["misses"] += 1
+        result = fn(*args, **kwargs)
+        _store(entry, result)
+        _evict(root, int(os.environ.get(ENV_MAX, DEFAULT_MAX_BYTES)))
+        return result
+    return wrapper
@@ -1,10 +1,76 @@
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from statsmodels.tsa.stattools import grangercausalitytests
+
+_RANK_TOL = 1e-10   # |diag R| below this fraction of the column scale counts as rank deficient
 
 def granger_pair(x, y, maxlag=5):
-    import warnings
-    warnings.filterwarnings("ignore")
+    from statsmodels.tsa.stattools import grangercausalitytests
     data = np.column_stack([y, x])  # test x->y
-    res = grangercausalitytests(data, maxlag=maxlag, verbose=False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res = grangercausalitytests(data, maxlag=maxlag, verbose=False)
     pvals = [res[lag][0]['ssr_ftest'][1] for lag in range(1, maxlag+1)]
     return float(min(pvals))
+
+def _lags(X, L):
+    """(N, T-L, L) lag tensor: [..., t, k] = X[:, L+t-k-1] (lag k+1)."""
+    T = X.shape[1]
+    return np.stack([X[:, L-k-1:T-k-1] for k in range(L)], axis=-1)
+
+def granger_matrix(X, maxlag=5):
+    """All-pairs Granger ssr F-tests for X of shape (channels, time).
+
+    For each lag L = 1..maxlag and target i, the restricted model (constant +
+    L own lags) is factored once; the unrestricted models of every source j
+    are solved together by projecting the sources' lag blocks off it (Frisch–
+    Waugh) and taking one stacked QR. Matches statsmodels' `ssr_ftest`.
+    Returns {"F", "p"} of shape (maxlag, N, N) indexed [L-1, source, target]
+    (diagonal NaN), "p_min" (N, N) over lags as in `granger_pair`, and "df".
+    Pairs whose design is rank deficient (constant or collinear series, where
+    statsmodels raises InfeasibleTestError) get NaN.
+    """
+    X = np.asarray(X, dtype=float)
+    N, T = X.shape
+    F = np.full((maxlag, N, N), np.nan); df = np.zeros(maxlag, dtype=int)
+    for L in range(1, maxlag+1):
+        lags = _lags(X, L)                        # (N, nobs, L)
+        nobs = T - L
+        df[L-1] = nobs - 2*L - 1
+        for i in range(N):
+            D = np.column_stack([lags[i], np.ones(nobs)])
+            Q, R = np.linalg.qr(D)
+            if np.any(np.abs(np.diag(R)) <= _RANK_TOL*np.linalg.norm(D, axis=0).max()): continue
+            y = X[i, L:]
+            e = y - Q @ (Q.T @ y)
+            ssr_r = e @ e
+            src = np.delete(np.arange(N), i)
+            M = lags[src] - Q @ (Q.T @ lags[src])   # sources' lags, restricted model projected out
+            Qm, Rm = np.linalg.qr(M)
+            ssr_u = ssr_r - np.sum((e @ Qm)**2, axis=-1)
+            scale = np.maximum(np.linalg.norm(lags[src], axis=1).max(axis=-1), np.linalg.norm(D, axis=0).max())
+            full = np.abs(np.diagonal(Rm, axis1=-2, axis2=-1)).min(axis=-1) > _RANK_TOL*scale
+            F[L-1, src, i] = np.where(full, (ssr_r - ssr_u) / ssr_u / L * df[L-1], np.nan)
+    from scipy.stats import f as f_dist
+    p = f_dist.sf(F, np.arange(1, maxlag+1)[:, None, None], df[:, None, None])
+    return {"F": F, "p": p, "p_min": np.min(p, axis=0), "df": df}
+
+def _granger_window(args):
+    X, maxlag = args
+    return granger_matrix(X, maxlag)
+
+def granger_matrix_windows(X, win, hop, maxlag=5, workers=None):
+    """`granger_matrix` on every (channels, win) window every `hop` samples, in a process pool.
+    Returns {"start", "F", "p", "p_min"} stacked over windows."""
+    X = np.asarray(X, dtype=float)
+    starts = np.arange(0, X.shape[1]-win+1, hop)
+    tasks = [(X[:, s:s+win], maxlag) for s in starts]
+    if workers and workers > 1:
+        with ProcessPoolExecutor(workers) as ex:
+            res = list(ex.map(_granger_window, tasks, chunksize=max(1, len(tasks)//(4*workers))))
+    else:
+        res = [_granger_window(t) for t in tasks]
+    out = {"start": starts}
+    for k in ("F", "p", "p_min"):
+        out[k] = np.stack([r[k] for r in res]) if res else np.empty((0,))
+    return out
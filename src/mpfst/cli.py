@@ -0,0 +1,46 @@
+"""Unified `mpfst` command line.
+
+    mpfst <command> [options]      (mpfst <command> -h for its options)
+
+Each subcommand is the existing module CLI, resolved by name and imported only
+when chosen, so e.g. `mpfst vbk` never loads NumPy, SciPy or pandas.
+"""
+import sys
+from importlib import import_module
+
+COMMANDS = {
+    "vbk": ("mpfst.gating.linear_response", "gw_vbk_cli", "GW VBK linear-response gate (single point or --catalog batch)"),
+    "superradiance": ("mpfst.domains.gw_superradiance", "cli", "Superradiance gate, ω_c and μ0; ranges write grids"),
+    "meter": ("mpfst.coherence.meter", "meter_cli", "Coherence triangle and mℓ of a CSV signal"),
+    "jumps": ("mpfst.spectral.octave_jump", "detect_shell_jumps_cli", "Octave shell-jump detection"),
+    "hazard": ("mpfst.gating.hazard", "hazard_cli", "Binned event hazard vs mℓ"),
+    "invert": ("mpfst.fractional.inversion", "invert_cli", "Predict β from (μ, γ, H) values or a table of them"),
+    "run": ("mpfst.runner", "runner_cli", "Run replication_manifest.yaml as a parallel, resumable stage DAG"),
+}
+
+def _usage():
+    width = max(map(len, COMMANDS))
+    lines = ["usage: mpfst <command> [options]", "", "commands:"]
+    lines += [f"  {name:<{width}}  {help_}" for name, (_, _, help_) in COMMANDS.items()]
+    return "\n".join(lines)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(_usage()); return 0
+    if argv[0] in ("-V", "--version"):
+        from mpfst import __version__
+        print(__version__); return 0
+    if argv[0] not in COMMANDS:
+        print(f"mpfst: unknown command '{argv[0]}'\n\n{_usage()}", file=sys.stderr); return 2
+    module, func, _ = COMMANDS[argv[0]]
+    saved = sys.argv
+    sys.argv = [f"mpfst {argv[0]}"] + argv[1:]   # the module CLIs parse sys.argv
+    try:
+        getattr(import_module(module), func)()
+    finally:
+        sys.argv = saved
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Batched detrended fluctuation analysis (DFA).
+
+Every segment of a given scale is detrended at once by projecting onto an
+orthonormal polynomial basis (closed-form least squares), so there is no
+per-segment Python loop. Inputs may carry leading batch axes (windows,
+channels); the time axis is always the last one.
+"""
+from functools import lru_cache
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import ArrayLike
+from ..trace import traced
+
+def dfa_scales(min_scale: int=8, max_scale: int=512, num_scales: int=12) -> np.ndarray:
+    """Log-spaced integer scales, as used by `hurst_dfa`."""
+    return np.unique(np.logspace(np.log10(min_scale), np.log10(max_scale), num_scales).astype(int))
+
+@lru_cache(maxsize=256)
+def _poly_basis(s: int, order: int) -> np.ndarray:
+    """Orthonormal basis (s, order+1) spanning polynomials of degree ≤ order on 0..s-1."""
+    t = np.linspace(-1.0, 1.0, s)
+    Q, _ = np.linalg.qr(np.vander(t, order+1, increasing=True))
+    Q.setflags(write=False)
+    return Q
+
+def _segments(y: np.ndarray, s: int, step: int, backward: bool) -> np.ndarray:
+    """View of y's segments of length s, shape (..., nseg, s). No copy."""
+    n = y.shape[-1]
+    if backward:
+        y = y[..., (n-s) % step:]  # align segments to the end of the record
+    return sliding_window_view(y, s, axis=-1)[..., ::step, :]
+
+def _rss_mean(y: np.ndarray, s: int, order: int, step: int, both: bool) -> np.ndarray:
+    """Mean squared detrending residual over all segments of scale s."""
+    Q = _poly_basis(s, order)
+    tot = 0.0; count = 0
+    for backward in ((False, True) if both else (False,)):
+        Z = _segments(y, s, step, backward)
+        R = Z - (Z @ Q) @ Q.T
+        tot = tot + np.einsum("...ij,...ij->...", R, R)
+        count += Z.shape[-2]*s
+    return tot / count
+
+def loglog_slope(x: ArrayLike, y: ArrayLike) -> np.ndarray:
+    """Least-squares slope of log10(y) against log10(x) along the last axis."""
+    lx = np.log10(np.asarray(x, dtype=float)); ly = np.log10(np.asarray(y, dtype=float))
+    lx = lx - lx.mean(axis=-1, keepdims=True)
+    ly = ly - ly.mean(axis=-1, keepdims=True)
+    return (lx*ly).sum(axis=-1) / (lx*lx).sum(axis=-1)
+
+@traced
+def dfa(x: ArrayLike, scales: ArrayLike|None=None, order: int=1, overlap: float=0.0,
+        both_directions: bool=False, min_scale: int=8, max_scale: int=512, num_scales: int=12) -> dict:
+    """DFA of order 1–3 along the last axis of x.
+
+    overlap ∈ [0,1) is the fraction shared by consecutive segments; with
+    both_directions the record is also segmented from its end (2·Ns segments).
+    Returns {"scales": (S,), "F": (..., S), "H": (...)} with F the fluctuation
+    function F(s) and H the slope of log F vs log s.
+    """
+    if order not in (1, 2, 3): raise ValueError("order must be 1, 2 or 3")
+    if not 0.0 <= overlap < 1.0: raise ValueError("overlap must be in [0, 1)")
+    x = np.asarray(x, dtype=float)
+    y = np.cumsum(x - x.mean(axis=-1, keepdims=True), axis=-1)
+    if scales is None: scales = dfa_scales(min_scale, max_scale, num_scales)
+    scales = np.asarray(scales, dtype=int)
+    S = [s for s in scales if s >= max(4, order+2) and s < y.shape[-1]]
+    F = np.stack([np.sqrt(_rss_mean(y, s, order, max(1, int(round(s*(1-overlap)))), both_directions))
+                  for s in S], axis=-1) if S else np.empty(x.shape[:-1]+(0,))
+    S = np.array(S, dtype=int)
+    H = loglog_slope(S, F) if len(S) >= 2 else np.full(x.shape[:-1], np.nan)
+    return {"scales": S, "F": F, "H": H}
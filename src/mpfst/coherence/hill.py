@@ -0,0 +1,131 @@
+"""Selection-based Hill estimation: full Hill plots and automatic k.
+
+Only the k_max+1 largest values are needed, so they are isolated with
+`np.partition` (O(n)) and only that block is sorted; the Hill estimate for
+every k ≤ k_max then follows from one cumulative sum of log order statistics.
+Inputs may carry leading batch axes (windows, channels); the time axis is
+always the last one. With `increments` (the default, as in
+`heavy_tail_mu_hill`) the estimator runs on |Δx|.
+"""
+import numpy as np
+from numpy.typing import ArrayLike
+from ..trace import traced
+
+def default_k_max(n: int, k_min: int=5) -> int:
+    return int(min(n-1, max(4*k_min, n//10)))
+
+def top_order_statistics(a: np.ndarray, m: int) -> np.ndarray:
+    """The m largest values along the last axis, sorted descending."""
+    a = np.asarray(a, dtype=float)
+    m = min(m, a.shape[-1])
+    top = -np.partition(-a, m-1, axis=-1)[..., :m] if m < a.shape[-1] else a
+    return -np.sort(-top, axis=-1)
+
+def hill_from_top(top: np.ndarray) -> np.ndarray:
+    """Hill tail index for k = 1..m-1 from descending order statistics (..., m);
+    NaN where the k+1-th value is not positive."""
+    lt = np.log(np.where(top > 0, top, 1.0))
+    csum = np.cumsum(lt, axis=-1)[..., :-1]
+    k = np.arange(1, top.shape[-1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = 1.0 / (csum/k - lt[..., 1:] + 1e-12)
+    return np.where(top[..., 1:] > 0, alpha, np.nan)
+
+def select_k(alpha: np.ndarray, k_min: int=5, method: str="stability", window: int|None=None) -> np.ndarray:
+    """Index into the Hill plot (k = index+1) chosen along the last axis.
+
+    "stability": centre of the window of `window` consecutive k (default
+    max(5, k_max/10)) over which the Hill plot varies least (smallest standard
+    deviation), computed for all windows from cumulative sums.
+    "amse": minimise a bias–variance proxy α_k²/k + (α_k − α_{k/2})², the
+    asymptotic Hill variance plus the drift of the plot over [k/2, k].
+    Rows with no usable k give -1.
+    """
+    A = np.asarray(alpha, dtype=float)
+    K = A.shape[-1]
+    lo = min(max(k_min, 1), K) - 1
+    ok = np.isfinite(A)
+    if method=="stability":
+        w = min(K - lo, window or max(5, K//10))
+        Z = np.where(ok, A, 0.0)
+        pad = np.zeros(A.shape[:-1]+(1,))
+        c1, c2, cn = (np.concatenate([pad, np.cumsum(v, axis=-1)], axis=-1) for v in (Z, Z*Z, ok.astype(float)))
+        s1, s2, n = (c[..., w:] - c[..., :-w] for c in (c1, c2, cn))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sd = np.sqrt(np.maximum(s2/n - (s1/n)**2, 0.0))
+        sd = np.where(n == w, sd, np.inf)
+        sd[..., :lo] = np.inf
+        best = np.argmin(sd, axis=-1) + w//2
+        found = np.isfinite(np.min(sd, axis=-1))
+    elif method=="amse":
+        k = np.arange(1, K+1)
+        half = np.maximum(k//2, 1) - 1
+        with np.errstate(invalid="ignore"):
+            crit = A*A/k + (A - A[..., half])**2
+        crit = np.where(np.isfinite(crit), crit, np.inf)
+        crit[..., :lo] = np.inf
+        best = np.argmin(crit, axis=-1)
+        found = np.isfinite(np.min(crit, axis=-1))
+    else:
+        raise ValueError(f"Unknown k selection method '{method}'")
+    return np.where(found, best, -1)
+
+def _pick(alpha, idx):
+    a = np.take_along_axis(alpha, np.maximum(idx, 0)[..., None], axis=-1)[..., 0]
+    return np.where(idx >= 0, a, np.nan)
+
+@traced
+def hill_plot(x: ArrayLike, k_max: int|None=None, increments: bool=True) -> dict:
+    """Hill tail index for every k = 1..k_max along the last axis.
+    Returns {"k": (K,), "alpha": (..., K)}."""
+    a = np.abs(np.diff(np.asarray(x, dtype=float), axis=-1) if increments else np.asarray(x, dtype=float))
+    k_max = default_k_max(a.shape[-1]) if k_max is None else min(int(k_max), a.shape[-1]-1)
+    alpha = hill_from_top(top_order_statistics(a, k_max+1))
+    return {"k": np.arange(1, alpha.shape[-1]+1), "alpha": alpha}
+
+def hill_estimate(x: ArrayLike, k: int|str="auto", k_max: int|None=None, k_min: int=5,
+                  method: str="stability", increments: bool=True) -> dict:
+    """Tail index at a fixed k or at the automatically selected k ("auto").
+    Returns {"alpha", "k"} (floats / ints for 1-D input, arrays per row otherwise; k=0 if none)."""
+    if k != "auto": k_max = int(k)
+    plot = hill_plot(x, k_max, increments)
+    A = plot["alpha"]
+    idx = select_k(A, k_min, method) if k=="auto" else np.full(A.shape[:-1], A.shape[-1]-1)
+    alpha, kk = _pick(A, idx), idx + 1
+    if np.ndim(alpha)==0: return {"alpha": float(alpha), "k": int(kk)}
+    return {"alpha": alpha, "k": kk}
+
+@traced
+def rolling_hill(x: ArrayLike, win: int, hop: int, fs: float=1.0, k_max: int|None=None, k_min: int=5,
+                 method: str="stability", increments: bool=True) -> dict:
+    """Hill tail index with automatic k for windows of `win` samples every `hop`.
+
+    Order statistics are carried between overlapping windows: the 2·(k_max+1)
+    largest values still inside the window are merged with the `hop` new ones
+    and re-partitioned, an O(k_max + hop) step. This is exact while the merged
+    k_max+1-th value is not below a running bound on every value left out;
+    otherwise (a large value has left) the window is partitioned from scratch. Returns {"t" (window centre, s), "alpha", "k", "plot"} with
+    plot the (windows, k_max) Hill plot.
+    """
+    x = np.asarray(x, dtype=float)
+    a = np.abs(np.diff(x)) if increments else x
+    n = a.shape[0]; w = int(win) - (1 if increments else 0); hop = int(hop)
+    starts = np.arange(0, n - w + 1, hop)
+    k_max = default_k_max(w, k_min) if k_max is None else min(int(k_max), w-1)
+    m, keep = k_max + 1, 2*(k_max + 1)
+    tops = np.empty((len(starts), m))
+    pos, bound = None, -np.inf     # carried positions; every other in-window value is <= bound
+    for i, s in enumerate(starts):
+        if pos is not None and hop < w:
+            cand = np.concatenate([pos[pos >= s], np.arange(s+w-hop, s+w)])
+            pos = cand[np.argpartition(-a[cand], min(keep, len(cand))-1)[:keep]]
+            top = np.sort(a[pos])[::-1][:m]
+            if len(top) == m and top[-1] >= bound:
+                if len(cand) > keep: bound = max(bound, a[pos].min())
+                tops[i] = top; continue
+        pos = s + np.argpartition(-a[s:s+w], min(keep, w)-1)[:keep]
+        bound = a[pos].min() if w > keep else -np.inf
+        tops[i] = np.sort(a[pos])[::-1][:m]
+    alpha = hill_from_top(tops)
+    sel = select_k(alpha, k_min, method)
+    return {"t": (starts + win/2) / fs, "alpha": _pick(alpha, sel), "k": sel + 1, "plot": alpha}
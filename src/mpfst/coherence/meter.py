@@ -1,11 +1,14 @@
 import numpy as np
 
 def compute_m_l(mu: float|None, gamma: float|None, H: float|None,
-                weights=(0.33,0.33,0.34)) -> float:
+                weights=(0.33,0.33,0.34)) -> float|np.ndarray:
     """Combine (μ, γ, H) into a coherence meter mℓ ∈ [0,1].
     Heavier tails (smaller μ), steeper spectra (larger γ), and stronger memory (H>0.5)
     increase mℓ. Thresholds: m1≈0.33, m2≈0.66.
+    Array inputs broadcast and give an mℓ array (e.g. one value per channel).
     """
+    if any(np.ndim(v) > 0 for v in (mu, gamma, H)):
+        return _m_l_array(*(np.nan if v is None else v for v in (mu, gamma, H)), weights=weights)
     w1,w2,w3 = weights
     terms = []
     if mu is not None and np.isfinite(mu):
@@ -20,3 +23,26 @@ def compute_m_l(mu: float|None, gamma: float|None, H: float|None,
         terms.append(w3*t)
     score = sum(terms) / (w1+w2+w3)
     return float(np.clip(score, 0, 1))
+
+def _m_l_array(mu, gamma, H, weights=(0.33,0.33,0.34)) -> np.ndarray:
+    """Element-wise `compute_m_l` over arrays; non-finite inputs drop their term."""
+    w1,w2,w3 = weights
+    mu, gamma, H = (np.asarray(v, dtype=float) for v in (mu, gamma, H))
+    score = (w1*np.where(np.isfinite(mu), np.clip((2.0 - (mu-1.0)) / 2.0, 0, 1), 0.0)
+             + w2*np.where(np.isfinite(gamma), np.clip(gamma/2.0, 0, 1), 0.0)
+             + w3*np.where(np.isfinite(H), np.clip((H-0.5)/0.5, 0, 1), 0.0))
+    return np.clip(score / (w1+w2+w3), 0, 1)
+
+def meter_cli():
+    import argparse
+    from mpfst.io import add_input_args, signal_from_args
+    ap = argparse.ArgumentParser(description="Coherence triangle (μ, γ, H) and mℓ of a signal")
+    add_input_args(ap)
+    args = ap.parse_args()
+    from .metrics import spectral_slope_gamma, hurst_dfa, heavy_tail_mu_hill
+    x, fs = signal_from_args(args)
+    mu = heavy_tail_mu_hill(x)
+    gamma = spectral_slope_gamma(x, fs=fs)
+    H = hurst_dfa(x)
+    m_l = compute_m_l(mu, gamma, H)
+    print(f"mu={mu:.3f}, gamma={gamma:.3f}, H={H:.3f}, m_l={m_l:.3f}")
@@ -1,12 +1,20 @@
 import numpy as np
 from scipy.signal import welch
 from numpy.typing import ArrayLike
+from .dfa import dfa
+from .hill import top_order_statistics, hill_estimate
+from ..cache import memoize
+from ..trace import traced, span
 
-def spectral_slope_gamma(x: ArrayLike, fs: float, fmin: float=0.5, fmax: float|None=None) -> float:
-    """Estimate 1/f^γ slope via log–log fit of Welch PSD between fmin..fmax."""
+@traced
+@memoize
+def spectral_slope_gamma(x: ArrayLike, fs: float, fmin: float=0.5, fmax: float|None=None) -> float|np.ndarray:
+    """Estimate 1/f^γ slope via log–log fit of Welch PSD between fmin..fmax.
+    For (channels, time) input returns one γ per row (batched Welch + least squares)."""
     x = np.asarray(x, dtype=float)
+    if x.ndim > 1: return _gamma_rows(x, fs, fmin=fmin, fmax=fmax)
     if fmax is None: fmax = fs/2*0.95
-    f, Pxx = welch(x, fs=fs, nperseg=min(4096, max(256, int(fs*2))))
+    with span("scipy.welch"): f, Pxx = welch(x, fs=fs, nperseg=_welch_nperseg(fs))
     m = (f>=fmin) & (f<=fmax) & (Pxx>0)
     F = np.log10(f[m]); S = np.log10(Pxx[m])
     A = np.vstack([np.ones_like(F), -F]).T  # P ~ f^{-γ} => logP = c - γ log f
@@ -14,43 +22,79 @@ def spectral_slope_gamma(x: ArrayLike, fs: float, fmin: float=0.5, fmax: float|N
     gamma = coef[1]
     return float(gamma)
 
-def hurst_dfa(x: ArrayLike, min_scale: int=8, max_scale: int=512, num_scales: int=12) -> float:
-    """Simple DFA (order-1) estimate of Hurst exponent."""
-    x = np.asarray(x, dtype=float)
-    y = np.cumsum(x - np.mean(x))
-    scales = np.unique(np.logspace(np.log10(min_scale), np.log10(max_scale), num_scales).astype(int))
-    F = []
-    for s in scales:
-        if s<4 or s>=len(y): continue
-        nseg = len(y)//s
-        z = y[:nseg*s].reshape(nseg, s)
-        t = np.arange(s)
-        # detrend each segment
-        res = []
-        for seg in z:
-            A = np.vstack([np.ones_like(t), t]).T
-            coef, *_ = np.linalg.lstsq(A, seg, rcond=None)
-            res.append(seg - (coef[0]+coef[1]*t))
-        res = np.concatenate(res)
-        F.append(np.sqrt(np.mean(res**2)))
-    F = np.array(F); S = scales[:len(F)]
-    A = np.vstack([np.ones_like(np.log10(S)), np.log10(S)]).T
-    coef, *_ = np.linalg.lstsq(A, np.log10(F), rcond=None)
-    H = coef[1]
-    return float(H)
-
-def heavy_tail_mu_hill(x: ArrayLike, q: float=0.95) -> float:
-    """Hill estimator on absolute increments; returns tail index μ (Pareto-like)."""
+@traced
+@memoize
+def hurst_dfa(x: ArrayLike, min_scale: int=8, max_scale: int=512, num_scales: int=12) -> float|np.ndarray:
+    """Simple DFA (order-1) estimate of Hurst exponent, per row for (channels, time) input.
+    See `mpfst.coherence.dfa` for the full engine."""
+    H = dfa(x, min_scale=min_scale, max_scale=max_scale, num_scales=num_scales)["H"]
+    return float(H) if np.ndim(H)==0 else H
+
+@traced
+@memoize
+def heavy_tail_mu_hill(x: ArrayLike, q: float=0.95, k: int|str|None=None) -> float|np.ndarray:
+    """Hill estimator on absolute increments; returns tail index μ (Pareto-like).
+    For (channels, time) input returns one μ per row (row-wise partial sort).
+    By default the top (1-q) fraction is used; `k` fixes the number of order
+    statistics instead, or "auto" selects it from the Hill plot (`mpfst.coherence.hill`)."""
     x = np.asarray(x, dtype=float)
+    if k is not None:
+        if x.ndim == 1: return _hill_k(x, k)
+        return np.array([_hill_k(r, k) for r in x.reshape(-1, x.shape[-1])]).reshape(x.shape[:-1])
+    if x.ndim > 1: return _hill_rows(x, q=q)
     dx = np.diff(x)
     a = np.abs(dx)
     a = a[a>0]
     if len(a)<10: return float("nan")
     k = max(5, int(len(a)*(1-q)))
-    a_sorted = np.sort(a)[::-1]
+    a_sorted = top_order_statistics(a, k+1)   # partial sort: only the top k+1 are ordered
     top = a_sorted[:k]
     xmin = a_sorted[k] if k<len(a_sorted) else a_sorted[-1]
     if np.any(top<=0) or xmin<=0: return float("nan")
     hill = 1.0 / (np.mean(np.log(top/xmin)) + 1e-12)
     # map Hill alpha→ μ; here we use μ≈alpha (tail exponent), consistent for Pareto tails
     return float(hill)
+
+def _hill_k(x, k):
+    """Hill μ at a fixed or automatic k on the positive |Δx| of one series (NaN below 10)."""
+    a = np.abs(np.diff(x))
+    a = a[a>0]
+    return hill_estimate(a, k=k, increments=False)["alpha"] if len(a)>=10 else float("nan")
+
+# --- batched row-wise variants (time on the last axis) ---
+def _welch_nperseg(fs: float) -> int:
+    return min(4096, max(256, int(fs*2)))
+
+def _psd_slope(f: np.ndarray, P: np.ndarray, fmin: float, fmax: float) -> np.ndarray:
+    """γ from PSD rows P(f): masked log–log least squares over fmin..fmax."""
+    band = (f>=fmin) & (f<=fmax)
+    F = np.log10(f[band]); P = P[..., band]
+    w = (P>0).astype(float)  # per-row mask, as Pxx>0 in the 1-D fit
+    S = np.log10(np.where(P>0, P, 1.0))
+    n = w.sum(axis=-1, keepdims=True)
+    dF = w*(F - (w*F).sum(axis=-1, keepdims=True)/n)
+    dS = S - (w*S).sum(axis=-1, keepdims=True)/n
+    return -(dF*dS).sum(axis=-1) / (dF*dF).sum(axis=-1)
+
+def _gamma_rows(X: np.ndarray, fs: float, fmin: float=0.5, fmax: float|None=None) -> np.ndarray:
+    """`spectral_slope_gamma` for every row of X, from one batched Welch call."""
+    X = np.asarray(X, dtype=float)
+    if fmax is None: fmax = fs/2*0.95
+    with span("scipy.welch"): f, P = welch(X, fs=fs, nperseg=_welch_nperseg(fs), axis=-1)
+    return _psd_slope(f, P, fmin, fmax)
+
+def _hill_rows(X: np.ndarray, q: float=0.95) -> np.ndarray:
+    """`heavy_tail_mu_hill` for every row of X via a row-wise partial sort."""
+    A = np.abs(np.diff(np.asarray(X, dtype=float), axis=-1))
+    npos = (A>0).sum(axis=-1)
+    k = np.maximum(5, (npos*(1-q)).astype(int))
+    kk = min(int(k.max())+1, A.shape[-1])
+    top = -np.partition(-A, kk-1, axis=-1)[..., :kk] if kk<A.shape[-1] else A
+    top = -np.sort(-top, axis=-1)
+    csum = np.cumsum(np.log(np.where(top>0, top, 1.0)), axis=-1)
+    kc = np.minimum(k, kk-1)[..., None]
+    mean_log = np.take_along_axis(csum, kc-1, axis=-1)[..., 0] / kc[..., 0]
+    xmin = np.take_along_axis(top, kc, axis=-1)[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hill = 1.0 / (mean_log - np.log(xmin) + 1e-12)
+    return np.where((npos>=10) & (xmin>0), hill, np.nan)
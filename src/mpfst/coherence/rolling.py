@@ -0,0 +1,40 @@
+"""Rolling-window coherence triangle (μ, γ, H) and mℓ over a whole record.
+
+Windows are strided views of the input (no copy); each batch of windows goes
+through one Welch call, one row-wise Hill pass and one batched DFA.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import ArrayLike
+from .metrics import _gamma_rows, _hill_rows
+from .dfa import dfa
+from .meter import _m_l_array
+from ..trace import traced
+
+def window_view(x: ArrayLike, win: int, hop: int) -> np.ndarray:
+    """(n_windows, win) view of every full window of x starting at multiples of hop."""
+    x = np.asarray(x)
+    if win > x.shape[-1]: return np.empty(x.shape[:-1]+(0, win), dtype=x.dtype)
+    return sliding_window_view(x, win, axis=-1)[..., ::hop, :]
+
+@traced
+def rolling_coherence(x: ArrayLike, fs: float, win: int, hop: int,
+                      fmin: float=0.5, fmax: float|None=None, q: float=0.95,
+                      min_scale: int=8, max_scale: int=512, num_scales: int=12,
+                      weights=(0.33,0.33,0.34), batch: int=512) -> dict:
+    """μ, γ, H and mℓ for windows of `win` samples every `hop` samples.
+
+    Returns aligned arrays {"t", "mu", "gamma", "H", "m_l"}; t is the window
+    centre in seconds. `batch` bounds how many windows are processed at once.
+    """
+    x = np.asarray(x, dtype=float)
+    W = window_view(x, int(win), int(hop))
+    n = W.shape[0]
+    mu, gamma, H = np.empty(n), np.empty(n), np.empty(n)
+    for i in range(0, n, batch):
+        B = W[i:i+batch]
+        mu[i:i+batch] = _hill_rows(B, q=q)
+        gamma[i:i+batch] = _gamma_rows(B, fs, fmin=fmin, fmax=fmax)
+        H[i:i+batch] = dfa(B, min_scale=min_scale, max_scale=max_scale, num_scales=num_scales)["H"]
+    t = (np.arange(n)*hop + win/2) / fs
+    return {"t": t, "mu": mu, "gamma": gamma, "H": H, "m_l": _m_l_array(mu, gamma, H, weights)}
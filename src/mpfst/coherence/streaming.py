@@ -0,0 +1,110 @@
+"""Online mℓ meter with bounded memory.
+
+The stream is cut into blocks of `hop` samples. Each block keeps only small
+sufficient statistics — the sum of its Welch segment periodograms, the top-k
+absolute increments, and per-scale DFA residual sums — and the meter holds the
+last `window // hop` blocks. Every closed block emits an mℓ for the trailing
+window without revisiting past samples. Segment grids are aligned to the start
+of the stream, so values track (but are not bit-identical to) the batch metrics
+on the same window.
+"""
+from collections import deque
+import numpy as np
+from scipy.signal import welch
+from numpy.typing import ArrayLike
+from .metrics import _welch_nperseg, _psd_slope
+from .dfa import dfa_scales, loglog_slope, _poly_basis
+from .meter import compute_m_l
+
+class CoherenceMeter:
+    """Streaming (μ, γ, H) → mℓ over a sliding window of `window` samples, emitted every `hop`."""
+
+    def __init__(self, fs: float, window: int, hop: int, fmin: float=0.5, fmax: float|None=None,
+                 q: float=0.95, min_scale: int=8, max_scale: int=512, num_scales: int=12,
+                 weights=(0.33,0.33,0.34)):
+        if hop <= 0 or window < hop or window % hop:
+            raise ValueError("window must be a positive multiple of hop")
+        self.fs, self.window, self.hop = float(fs), int(window), int(hop)
+        self.fmin, self.fmax = fmin, (fs/2*0.95 if fmax is None else fmax)
+        self.q, self.weights = q, weights
+        self.nperseg = min(_welch_nperseg(fs), self.window)
+        self.step = self.nperseg - self.nperseg//2
+        self.scales = np.array([s for s in dfa_scales(min_scale, max_scale, num_scales) if 4 <= s < self.window])
+        self.k_cap = max(5, int(self.window*(1-q))) + 1
+        self._blocks = deque(maxlen=self.window // self.hop)
+        self._tail = np.empty(0)
+        self._n = 0
+        self._freqs = None
+        self._last = {"mu": np.nan, "gamma": np.nan, "H": np.nan, "m_l": np.nan}
+        self._new_block()
+
+    def _new_block(self):
+        self._b = {"n": 0, "psd": 0.0, "nseg": 0, "top": np.empty(0), "npos": 0,
+                   "rss": np.zeros(len(self.scales)), "nfit": np.zeros(len(self.scales), dtype=int)}
+
+    def update(self, chunk: ArrayLike) -> np.ndarray:
+        """Consume samples; return the mℓ values emitted by blocks closed in this call."""
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        out = []
+        while len(chunk):
+            piece, chunk = np.split(chunk, [self.hop - self._b["n"]])
+            self._ingest(piece)
+            if self._b["n"] == self.hop:
+                self._blocks.append(self._b)
+                self._new_block()
+                if len(self._blocks) == self._blocks.maxlen:
+                    out.append(self._evaluate()["m_l"])
+        return np.array(out)
+
+    def value(self) -> dict:
+        """Latest {"mu", "gamma", "H", "m_l"}; NaN until the first full window."""
+        return dict(self._last)
+
+    def _ingest(self, piece: np.ndarray):
+        b = self._b
+        buf = np.concatenate([self._tail, piece])
+        start = self._n - len(self._tail)   # stream index of buf[0]
+        end = self._n + len(piece)
+        # Welch: segments on the stream grid that end inside this piece
+        j0 = max(0, -(-(self._n + 1 - self.nperseg) // self.step))
+        j1 = (end - self.nperseg) // self.step + 1
+        if j1 > j0:
+            idx = np.arange(j0, j1)[:, None]*self.step - start + np.arange(self.nperseg)
+            f, P = welch(buf[idx], fs=self.fs, nperseg=self.nperseg, axis=-1)
+            self._freqs = f
+            b["psd"] = b["psd"] + P.sum(axis=0); b["nseg"] += len(P)
+        # Hill: absolute increments, keep only the block's top k_cap
+        a = np.abs(np.diff(buf[-len(piece)-1:] if len(buf) > len(piece) else buf))
+        a = a[a>0]
+        b["npos"] += len(a)
+        top = np.concatenate([b["top"], a])
+        b["top"] = -np.partition(-top, self.k_cap-1)[:self.k_cap] if len(top) > self.k_cap else top
+        # DFA: completed segments of each scale; the order-1 detrend absorbs profile offsets
+        for i, s in enumerate(self.scales):
+            j0, j1 = self._n // s, end // s
+            if j1 > j0:
+                Z = np.cumsum(buf[j0*s-start:j1*s-start].reshape(-1, s), axis=1)
+                Q = _poly_basis(int(s), 1)
+                R = Z - (Z @ Q) @ Q.T
+                b["rss"][i] += np.sum(R*R); b["nfit"][i] += len(Z)
+        keep = max(self.nperseg, int(self.scales.max()) if len(self.scales) else 0)
+        self._tail = buf[-keep:] if keep else buf[:0]
+        self._n = end
+        b["n"] += len(piece)
+
+    def _evaluate(self) -> dict:
+        blocks = self._blocks
+        nseg = sum(b["nseg"] for b in blocks)
+        gamma = float(_psd_slope(self._freqs, sum(b["psd"] for b in blocks)/nseg, self.fmin, self.fmax)) if nseg else np.nan
+        top = np.concatenate([b["top"] for b in blocks]); npos = sum(b["npos"] for b in blocks)
+        mu = np.nan
+        if npos >= 10:
+            k = min(max(5, int(npos*(1-self.q))), len(top)-1)
+            top = -np.sort(np.partition(-top, k)[:k+1])
+            mu = 1.0 / (np.mean(np.log(top[:k]/top[k])) + 1e-12)
+        rss = sum(b["rss"] for b in blocks); nfit = sum(b["nfit"] for b in blocks)
+        ok = nfit > 0
+        H = float(loglog_slope(self.scales[ok], np.sqrt(rss[ok]/(nfit[ok]*self.scales[ok])))) if ok.sum() >= 2 else np.nan
+        m_l = compute_m_l(mu, gamma, H, weights=self.weights)
+        self._last = {"mu": float(mu), "gamma": gamma, "H": H, "m_l": m_l}
+        return self._last
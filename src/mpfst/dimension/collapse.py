@@ -1,12 +1,74 @@
 import numpy as np
-from sklearn.decomposition import PCA
 
 def participation_ratio(singular_values: np.ndarray) -> float:
     s2 = (singular_values**2)
     return float((s2.sum()**2) / ( (s2**2).sum() + 1e-12))
 
-def low_rank_collapse(X: np.ndarray, k: int|None=None):
-    pca = PCA(n_components=min(X.shape))
-    pca.fit(X)
-    pr = participation_ratio(pca.singular_values_)
-    return {"pr": pr, "singular_values": pca.singular_values_}
+def _pr_from_second_moment(C) -> float:
+    """PR = (tr C)² / ||C||_F² — equals participation_ratio of the singular values whose squares are C's eigenvalues."""
+    return float(np.trace(C)**2 / (np.sum(C*C) + 1e-12))
+
+def _second_moment(Xc):
+    """Xcᵀ Xc or Xc Xcᵀ, whichever is smaller; both share the nonzero spectrum."""
+    return Xc.T @ Xc if Xc.shape[1] <= Xc.shape[0] else Xc @ Xc.T
+
+def randomized_svd(X: np.ndarray, k: int, oversample: int=10, n_iter: int=4, seed=None):
+    """Leading k singular values and vectors (U, s, Vt) by randomized range finding (Halko et al.)."""
+    rng = np.random.default_rng(seed)
+    Q = X @ rng.standard_normal((X.shape[1], min(k+oversample, min(X.shape))))
+    for _ in range(n_iter):   # power iterations, re-orthonormalized
+        Q, _ = np.linalg.qr(Q)
+        Q, _ = np.linalg.qr(X.T @ Q)
+        Q = X @ Q
+    Q, _ = np.linalg.qr(Q)
+    Ub, s, Vt = np.linalg.svd(Q.T @ X, full_matrices=False)
+    return (Q @ Ub)[:, :k], s[:k], Vt[:k]
+
+def low_rank_collapse(X: np.ndarray, k: int|None=None, seed=None):
+    """Participation ratio of X (samples, features) after centering each feature.
+
+    PR comes from the smaller of the covariance / Gram matrices, with no full
+    PCA. "singular_values" are the full spectrum, or with k the leading k from
+    a randomized SVD (PR stays exact either way).
+    """
+    X = np.asarray(X, dtype=float)
+    Xc = X - X.mean(axis=0)
+    C = _second_moment(Xc)
+    if k is None:
+        s = np.sqrt(np.clip(np.linalg.eigvalsh(C)[::-1], 0, None))
+    else:
+        s = randomized_svd(Xc, k, seed=seed)[1]
+    return {"pr": _pr_from_second_moment(C), "singular_values": s}
+
+def sliding_participation_ratio(X: np.ndarray, win: int, hop: int=1, refresh: int=1024) -> dict:
+    """PR time series of X (time, channels) over windows of `win` samples every `hop`.
+
+    With channels ≤ win the sums Σy and Σyyᵀ of y = x − c are updated as the
+    window slides (adding the `hop` entering rows, removing the leaving ones)
+    and recomputed from scratch every `refresh` steps to bound round-off; the
+    centred covariance is then Σyyᵀ − ΣyΣyᵀ/win. The shift c is the mean of the
+    window at the last refresh, so a large DC offset does not cancel
+    catastrophically in the subtraction. With more channels than
+    samples each window's Gram matrix is used instead.
+    Returns {"start", "pr"} with window start indices in samples.
+    """
+    X = np.asarray(X, dtype=float)
+    T, p = X.shape
+    starts = np.arange(0, T-win+1, hop)
+    pr = np.empty(len(starts))
+    if p > win or hop >= win:
+        for i, s in enumerate(starts):
+            W = X[s:s+win]
+            pr[i] = _pr_from_second_moment(_second_moment(W - W.mean(axis=0)))
+        return {"start": starts, "pr": pr}
+    for i, s in enumerate(starts):
+        if i % refresh == 0:
+            c = X[s:s+win].mean(axis=0)
+            W = X[s:s+win] - c
+            S, Q = W.sum(axis=0), W.T @ W
+        else:
+            add, rem = X[s+win-hop:s+win] - c, X[s-hop:s] - c
+            S += add.sum(axis=0) - rem.sum(axis=0)
+            Q += add.T @ add - rem.T @ rem
+        pr[i] = _pr_from_second_moment(Q - np.outer(S, S)/win)
+    return {"start": starts, "pr": pr}
@@ -10,6 +10,8 @@ Q≈0, these reduce to μ > 0 and μ < Ω_H, where Ω_H = a / (r_+^2 + a^2).
 The functions below are lightweight and pure-python; they do not depend on
 external packages. They are intended to *evaluate* MPFST's domain-agnostic
 linear-response gate in the GR ringdown case without altering MPFST's core API.
+The `*_array` variants and `gate_grid` broadcast the same formulas over NumPy
+inputs (imported only when they are called) for large parameter scans.
 """
 from __future__ import annotations
 from dataclasses import dataclass
@@ -62,18 +64,105 @@ def imomega_quadratic_weight(params: BHParams, C: float = 1.0) -> float:
 def evaluate_gate_and_weight(params: BHParams, C: float = 1.0):
     return superradiance_overlap(params), imomega_quadratic_weight(params, C)
 
+# Array versions: same arithmetic as the scalar functions, broadcast over NumPy
+# inputs. Extremal points (M^2 < a^2 + Q^2) give NaN r_+ / ω_c and a closed gate.
+def r_plus_array(M, a, Q=0.0):
+    import numpy as np
+    M, a, Q = (np.asarray(v, dtype=float) for v in (M, a, Q))
+    disc = M*M - a*a - Q*Q
+    with np.errstate(invalid="ignore"):
+        return np.where(disc < 0, np.nan, M + np.sqrt(disc))
+
+def mu0_array(M, Q=0.0, q=0.0):
+    import numpy as np
+    M, Q, q = (np.asarray(v, dtype=float) for v in (M, Q, q))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(M!=0, (q * Q) / np.where(M!=0, M, 1.0), np.inf)
+
+def omega_c_array(M, a, Q=0.0, m=1, q=0.0):
+    import numpy as np
+    a, Q, q, m = (np.asarray(v, dtype=float) for v in (a, Q, q, m))
+    rp = r_plus_array(M, a, Q)
+    num = m * a + q * Q * rp
+    den = rp*rp + a*a
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return num / den
+
+def gate_grid(M, a, Q=0.0, m=1, q=0.0, mu=0.0, C: float = 1.0) -> dict:
+    """Broadcast gate over parameter arrays: {"gate", "weight", "omega_c", "mu0"}.
+    Elementwise equal to `evaluate_gate_and_weight` / `omega_c` / `mu0`, except that
+    extremal points get gate False, weight 0 and NaN ω_c instead of raising."""
+    import numpy as np
+    mu = np.asarray(mu, dtype=float)
+    w0 = mu0_array(M, Q, q)
+    wc = omega_c_array(M, a, Q, m, q)
+    gate = (mu > w0) & (mu < wc)
+    d = mu - w0
+    with np.errstate(invalid="ignore"):
+        weight = np.where(gate, C * (d*d), 0.0)
+    return {"gate": gate, "weight": weight, "omega_c": wc, "mu0": w0}
+
+GRID_AXES = ("M", "a", "Q", "m", "q", "mu")
+
+def _axis_values(spec: str):
+    """"v" -> [v]; "start:stop:num" -> linspace(start, stop, num)."""
+    import numpy as np
+    parts = spec.split(":")
+    if len(parts)==1: return np.array([float(spec)])
+    if len(parts)!=3: raise ValueError(f"Range must be start:stop:num, got '{spec}'")
+    return np.linspace(float(parts[0]), float(parts[1]), int(parts[2]))
+
+def write_gate_grid(axes: dict, out: str, C: float = 1.0, chunk: int = 1_000_000):
+    """Evaluate `gate_grid` on the outer product of `axes` (GRID_AXES order) in chunks of
+    `chunk` points, writing gate/weight/omega_c/mu0 grids without holding them in memory.
+    `out` ending in .npz gives one archive; otherwise `<out>_<name>.npy` per quantity."""
+    import os, tempfile, zipfile
+    import numpy as np
+    from numpy.lib.format import open_memmap
+    vals = [np.asarray(axes[k], dtype=float).ravel() for k in GRID_AXES]
+    shape = tuple(len(v) for v in vals)
+    total = int(np.prod(shape))
+    npz = out.endswith(".npz")
+    tmp = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(out))) if npz else None
+    names = {"gate": bool, "weight": float, "omega_c": float, "mu0": float}
+    paths = {k: os.path.join(tmp, k+".npy") if npz else f"{out}_{k}.npy" for k in names}
+    mm = {k: open_memmap(paths[k], mode="w+", dtype=dt, shape=shape) for k, dt in names.items()}
+    for lo in range(0, total, chunk):
+        idx = np.unravel_index(np.arange(lo, min(lo+chunk, total)), shape)
+        r = gate_grid(*(v[i] for v, i in zip(vals, idx)), C=C)
+        for k in names: mm[k].reshape(-1)[lo:lo+len(idx[0])] = r[k]
+    for k in names: mm[k].flush()
+    del mm
+    if npz:
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for k in names: zf.write(paths[k], arcname=k+".npy")
+        for k in names: os.remove(paths[k])
+        os.rmdir(tmp)
+        return [out]
+    return list(paths.values())
+
 # CLI helper
 def cli():
     import argparse, json
-    ap = argparse.ArgumentParser(description="Evaluate VBK superradiance gate for given BH parameters.")
-    ap.add_argument("--M", type=float, required=True)
-    ap.add_argument("--a", type=float, required=True)
-    ap.add_argument("--Q", type=float, default=0.0)
-    ap.add_argument("--m", type=int, default=1)
-    ap.add_argument("--q", type=float, default=0.0)
-    ap.add_argument("--mu", type=float, required=True)
+    ap = argparse.ArgumentParser(description="Evaluate VBK superradiance gate for given BH parameters."
+                                 " Any parameter may be a range start:stop:num; ranges need --out.")
+    ap.add_argument("--M", type=str, required=True)
+    ap.add_argument("--a", type=str, required=True)
+    ap.add_argument("--Q", type=str, default="0.0")
+    ap.add_argument("--m", type=str, default="1")
+    ap.add_argument("--q", type=str, default="0.0")
+    ap.add_argument("--mu", type=str, required=True)
     ap.add_argument("--C", type=float, default=1.0)
+    ap.add_argument("--out", default=None, help="Grid output: .npz archive or prefix for per-quantity .npy files")
+    ap.add_argument("--chunk", type=int, default=1_000_000, help="Grid points evaluated per chunk")
     args = ap.parse_args()
-    params = BHParams(M=args.M, a=args.a, Q=args.Q, m=args.m, q=args.q, mu=args.mu)
-    gate, w = evaluate_gate_and_weight(params, C=args.C)
-    print(json.dumps({"gate": gate, "weight": w, "omega_c": omega_c(params), "mu0": mu0(params)}))
+    specs = {k: getattr(args, k) for k in GRID_AXES}
+    if args.out is None and not any(":" in v for v in specs.values()):
+        params = BHParams(M=float(args.M), a=float(args.a), Q=float(args.Q), m=int(args.m), q=float(args.q), mu=float(args.mu))
+        gate, w = evaluate_gate_and_weight(params, C=args.C)
+        print(json.dumps({"gate": gate, "weight": w, "omega_c": omega_c(params), "mu0": mu0(params)}))
+        return
+    if args.out is None: ap.error("parameter ranges require --out")
+    axes = {k: _axis_values(v) for k, v in specs.items()}
+    for path in write_gate_grid(axes, args.out, C=args.C, chunk=args.chunk):
+        print(path)
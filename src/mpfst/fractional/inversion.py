@@ -1,9 +1,12 @@
 import argparse, numpy as np
 
-def invert_beta(mu: float|None, gamma: float|None, H: float|None, weights=(0.5,0.5)) -> float:
+def invert_beta(mu: float|None, gamma: float|None, H: float|None, weights=(0.5,0.5)) -> float|np.ndarray:
     """Predict β from (μ, γ, H). We combine γ and (2-μ) with optional H-aware weighting.
     This is a transparent heuristic aligned with MPFST addendum used in the memos.
+    Array inputs broadcast and give a β array (e.g. one value per window).
     """
+    if any(np.ndim(v) > 0 for v in (mu, gamma, H)):
+        return _beta_array(*(np.nan if v is None else v for v in (mu, gamma, H)), weights=weights)
     vals = []
     w = []
     if gamma is not None and np.isfinite(gamma):
@@ -16,10 +19,45 @@ def invert_beta(mu: float|None, gamma: float|None, H: float|None, weights=(0.5,0
     # Optional H modulation: if H strong, trust tails/spectra more (already reflected).
     return beta
 
+def _beta_array(mu, gamma, H=np.nan, weights=(0.5,0.5)) -> np.ndarray:
+    """Element-wise `invert_beta` (H only sets the broadcast shape); non-finite inputs drop their term, NaN if both do."""
+    mu, gamma, _ = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (mu, gamma, H)))
+    wg = np.where(np.isfinite(gamma), weights[0], 0.0)
+    wm = np.where(np.isfinite(mu), weights[1], 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        num = wg*np.where(wg>0, gamma, 0.0) + wm*np.where(wm>0, np.maximum(0.0, 2.0-mu), 0.0)
+        return np.where(wg+wm>0, num/(wg+wm), np.nan)
+
+def read_triples(path) -> dict:
+    """Columns {"mu", "gamma", "H"} from .csv (named columns; missing → NaN),
+    .npz (same keys) or .npy (an (n, 3) array in μ, γ, H order)."""
+    path = str(path)
+    if path.endswith(".npy"):
+        a = np.atleast_2d(np.load(path)).astype(float)
+        return {"mu": a[:, 0], "gamma": a[:, 1], "H": a[:, 2]}
+    if path.endswith(".npz"):
+        with np.load(path) as z:
+            n = len(z[z.files[0]])
+            return {k: (z[k].astype(float) if k in z.files else np.full(n, np.nan)) for k in ("mu", "gamma", "H")}
+    import pandas as pd
+    df = pd.read_csv(path)
+    return {k: (df[k].to_numpy(dtype=float) if k in df else np.full(len(df), np.nan)) for k in ("mu", "gamma", "H")}
+
 def invert_cli():
     ap = argparse.ArgumentParser()
     ap.add_argument("--mu", type=float, required=False)
     ap.add_argument("--gamma", type=float, required=False)
     ap.add_argument("--H", type=float, required=False)
+    ap.add_argument("--input", default=None, help="Table of (mu, gamma, H): .csv columns, .npz keys or an (n,3) .npy")
+    ap.add_argument("--out", default=None, help="Write the table with a beta column (.csv or .npz); default stdout CSV")
     args = ap.parse_args()
-    print(invert_beta(args.mu, args.gamma, args.H))
+    if args.input is None:
+        print(invert_beta(args.mu, args.gamma, args.H)); return
+    table = read_triples(args.input)
+    table["beta"] = invert_beta(table["mu"], table["gamma"], table["H"])
+    if args.out and args.out.endswith(".npz"):
+        np.savez(args.out, **table); return
+    import pandas as pd
+    df = pd.DataFrame(table)
+    if args.out: df.to_csv(args.out, index=False)
+    else: print(df.to_csv(index=False), end="")
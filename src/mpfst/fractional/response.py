@@ -1,9 +1,90 @@
 import numpy as np
 
-def predict_tail_exponent(beta: float) -> float:
+def predict_tail_exponent(beta: float|np.ndarray) -> float|np.ndarray:
     """In the fractional-relaxation picture, the late-time envelope ~ t^{-p} with p≈β."""
-    return float(beta)
+    return float(beta) if np.ndim(beta)==0 else np.asarray(beta, dtype=float).copy()
 
 def predict_group_delay_power(alpha: float) -> float:
     """For dispersion with fractional Laplacian order α, group delay ~ f^{α-2}."""
     return float(alpha-2.0)
+
+# --- batched late-time tails (time on the last axis) ---
+def envelope_rows(X: np.ndarray) -> np.ndarray:
+    """Hilbert envelope |x + i·H[x]| of every row of X from one batched FFT.
+    Rows are zero-padded to twice their length so the end does not wrap onto the start."""
+    X = np.asarray(X, dtype=float)
+    n = X.shape[-1]; m = 2*n
+    F = np.fft.fft(X, n=m, axis=-1)
+    h = np.zeros(m); h[0] = h[n] = 1.0; h[1:n] = 2.0
+    return np.abs(np.fft.ifft(F*h, axis=-1)[..., :n])
+
+def fit_tail_exponent(env: np.ndarray, fs: float=1.0, n_onsets: int=12, min_frac: float=0.02,
+                      max_frac: float=0.5, trim: float=0.05, floor: float=1e-3, min_points: int=8,
+                      tol: float=0.1) -> dict:
+    """Fit env ~ t^{-p} after each row's peak by log–log least squares.
+
+    Time runs from the row's envelope maximum; the last `trim` fraction of the
+    row is dropped (FFT-envelope edge effects), as are points below `floor`
+    times the peak (noise floor). Candidate onsets lie log-spaced between
+    `min_frac` and `max_frac` of each row's tail; every candidate fit comes
+    from suffix sums of log t, log env and their products, so all rows and
+    onsets are solved at once. The earliest onset whose residual variance is
+    within (1+`tol`) of the smallest (with at least `min_points` points) is kept.
+    Returns {"p", "onset" (s after the peak), "r2", "n"}; NaN where no fit is possible.
+    """
+    E = np.atleast_2d(np.asarray(env, dtype=float))
+    B, W = E.shape
+    end = max(1, int(round(W*(1-trim))))
+    peak = np.argmax(E[:, :end], axis=1)
+    j = np.arange(W)
+    top = np.take_along_axis(E, peak[:, None], axis=1)
+    valid = (j[None, :] > peak[:, None]) & (j[None, :] < end) & (E > floor*top) & (E > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lx = np.where(valid, np.log(np.maximum(j[None, :] - peak[:, None], 1) / fs), 0.0)
+        ly = np.where(valid, np.log(np.where(E > 0, E, 1.0)), 0.0)
+    v = valid.astype(float)
+    def suffix(a):   # S[:, o] = sum over j >= o; one zero column past the end
+        return np.concatenate([np.cumsum(a[:, ::-1], axis=1)[:, ::-1], np.zeros((B, 1))], axis=1)
+    S1, Sx, Sy, Sxx, Sxy, Syy = (suffix(a) for a in (v, lx, ly, lx*lx, lx*ly, ly*ly))
+    tail = np.maximum(end - 1 - peak, 0)
+    fr = np.geomspace(min_frac, max_frac, n_onsets)
+    onset = np.minimum(peak[:, None] + np.maximum(1, np.ceil(fr[None, :]*tail[:, None])).astype(int), W)
+    g = lambda S: np.take_along_axis(S, onset, axis=1)
+    n, sx, sy, sxx, sxy, syy = (g(S) for S in (S1, Sx, Sy, Sxx, Sxy, Syy))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cxx, cxy, cyy = sxx - sx*sx/n, sxy - sx*sy/n, syy - sy*sy/n
+        b = cxy / cxx
+        ss_res = np.maximum(cyy - b*cxy, 0.0)
+        var = np.where((n >= min_points) & (cxx > 0), ss_res / (n - 2), np.inf)
+    best = np.argmax(var <= (1+tol)*var.min(axis=1, keepdims=True), axis=1)[:, None]
+    ok = np.isfinite(np.take_along_axis(var, best, axis=1)[:, 0])
+    pick = lambda A: np.take_along_axis(A, best, axis=1)[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = 1.0 - pick(ss_res) / pick(cyy)
+    out = {"p": np.where(ok, -pick(b), np.nan),
+           "onset": np.where(ok, (pick(onset) - peak) / fs, np.nan),
+           "r2": np.where(ok, r2, np.nan), "n": np.where(ok, pick(n), 0).astype(int)}
+    return out if np.ndim(env) > 1 else {k: v[0] for k, v in out.items()}
+
+def prediction_table(x, fs: float, win: int, hop: int, weights=(0.5,0.5), batch: int=512,
+                     tail: dict|None=None, **coherence) -> dict:
+    """Predicted (β → p) versus observed late-time tail exponent for every window.
+
+    (μ, γ, H) per window come from `rolling_coherence` (extra keyword arguments
+    go to it), β from `invert_beta` and p_obs from `fit_tail_exponent` on each
+    window's Hilbert envelope (`tail` holds its options).
+    Returns aligned columns {"t", "mu", "gamma", "H", "beta", "p_pred", "p_obs",
+    "onset", "r2", "residual"} with residual = p_obs − p_pred.
+    """
+    from mpfst.coherence.rolling import rolling_coherence, window_view
+    from .inversion import invert_beta
+    x = np.asarray(x, dtype=float)
+    tri = rolling_coherence(x, fs, win, hop, batch=batch, **coherence)
+    beta = invert_beta(tri["mu"], tri["gamma"], tri["H"], weights=weights)
+    Wv = window_view(x, int(win), int(hop))
+    fits = [fit_tail_exponent(envelope_rows(Wv[i:i+batch]), fs, **(tail or {})) for i in range(0, len(Wv), batch)]
+    obs = {k: np.concatenate([f[k] for f in fits]) if fits else np.empty(0) for k in ("p", "onset", "r2")}
+    p_pred = predict_tail_exponent(beta)
+    return {"t": tri["t"], "mu": tri["mu"], "gamma": tri["gamma"], "H": tri["H"], "beta": beta,
+            "p_pred": p_pred, "p_obs": obs["p"], "onset": obs["onset"], "r2": obs["r2"],
+            "residual": obs["p"] - p_pred}
@@ -1,24 +1,74 @@
-import argparse, numpy as np
+import argparse, warnings, numpy as np
+
+class HazardAccumulator:
+    """Mergeable binned event hazard vs mℓ.
+
+    Holds per-bin sample and event counts only, so it can be updated chunk by
+    chunk and combined across shards/processes by adding counts (`merge`, `+`).
+    Bins with fewer than `min_count` samples report NaN, as in `hazard_curve`.
+    """
+    def __init__(self, bins=20, min_count=5):
+        self.bins, self.min_count = bins, min_count
+        self.edges = np.linspace(0,1,bins+1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.events = np.zeros(bins, dtype=np.int64)
+
+    def update(self, m_l, events):
+        m_l = np.asarray(m_l, dtype=float); events = np.asarray(events, dtype=bool)
+        idx = np.digitize(m_l, self.edges)-1
+        ok = (idx>=0) & (idx<self.bins)
+        self.counts += np.bincount(idx[ok], minlength=self.bins)
+        self.events += np.bincount(idx[ok & events], minlength=self.bins)
+        return self
+
+    def merge(self, other):
+        if other.bins!=self.bins: raise ValueError("Cannot merge accumulators with different bins")
+        self.counts += other.counts; self.events += other.events
+        return self
+
+    def __add__(self, other):
+        out = HazardAccumulator(self.bins, self.min_count)
+        return out.merge(self).merge(other)
+
+    @property
+    def centers(self):
+        return 0.5*(self.edges[:-1]+self.edges[1:])
+
+    def _hazard(self, counts, events):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(counts>=self.min_count, events/counts, np.nan)
+
+    def result(self):
+        """(centers, hazard) as returned by `hazard_curve`."""
+        return self.centers, self._hazard(self.counts, self.events)
+
+    def bands(self, alpha=0.05, n_boot=1000, seed=None):
+        """Bootstrap (lo, hi) hazard bands, resampling the pooled (bin, event) cells multinomially."""
+        rng = np.random.default_rng(seed)
+        cells = np.concatenate([self.events, self.counts-self.events])
+        n = int(cells.sum())
+        if n==0: return np.full(self.bins, np.nan), np.full(self.bins, np.nan)
+        draws = rng.multinomial(n, cells/n, size=n_boot)
+        ev, non = draws[:, :self.bins], draws[:, self.bins:]
+        h = self._hazard(ev+non, ev)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # bins that are empty in every draw
+            lo, hi = np.nanquantile(h, [alpha/2, 1-alpha/2], axis=0)
+        return lo, hi
 
 def hazard_curve(m_l: np.ndarray, events: np.ndarray, bins=20):
-    m_l = np.asarray(m_l, dtype=float); events = np.asarray(events, dtype=bool)
-    edges = np.linspace(0,1,bins+1)
-    idx = np.digitize(m_l, edges)-1
-    hazard = []
-    centers = 0.5*(edges[:-1]+edges[1:])
-    for b in range(bins):
-        mask = idx==b
-        if mask.sum()<5:
-            hazard.append(np.nan); continue
-        hazard.append(events[mask].mean())
-    return centers, np.array(hazard)
+    return HazardAccumulator(bins).update(m_l, events).result()
 
 def hazard_cli():
     ap = argparse.ArgumentParser()
     ap.add_argument("--ml_csv", required=True, help="CSV with columns m_l,event")
+    ap.add_argument("--bins", type=int, default=20)
+    ap.add_argument("--chunksize", type=int, default=1_000_000, help="Rows per CSV chunk")
     args = ap.parse_args()
     import pandas as pd
-    df = pd.read_csv(args.ml_csv)
-    c, h = hazard_curve(df["m_l"].values, df["event"].values.astype(bool))
+    acc = HazardAccumulator(args.bins)
+    for df in pd.read_csv(args.ml_csv, usecols=["m_l", "event"], chunksize=args.chunksize):
+        acc.update(df["m_l"].values, df["event"].values.astype(bool))
+    c, h = acc.result()
     for ci, hi in zip(c, h):
         print(f"{ci:.3f},{hi if np.isfinite(hi) else 'nan'}")
@@ -7,19 +7,42 @@ evaluator (gw_superradiance). Other domains can register their own adapters.
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Dict, Any, Tuple
+from typing import Callable, Dict, Any, Tuple, Optional
 
 # Registry pattern so we don't hard-wire domains
 _REGISTRY: Dict[str, Callable[..., Tuple[bool, float]]] = {}
+_MANY: Dict[str, Callable[..., Tuple[Any, Any]]] = {}
 
-def register(domain: str, fn: Callable[..., Tuple[bool, float]]):
+def register(domain: str, fn: Callable[..., Tuple[bool, float]],
+             many: Optional[Callable[..., Tuple[Any, Any]]] = None):
+    """Register a per-point evaluator and, optionally, a vectorized one taking
+    broadcastable arrays and returning (gate, weight) arrays."""
     _REGISTRY[domain] = fn
+    if many is not None: _MANY[domain] = many
+    else: _MANY.pop(domain, None)
 
 def evaluate(domain: str, **kwargs) -> Tuple[bool, float]:
     if domain not in _REGISTRY:
         raise KeyError(f"No linear-response evaluator registered for domain '{domain}'")
     return _REGISTRY[domain](**kwargs)
 
+def evaluate_many(domain: str, **kwargs):
+    """Evaluate over broadcast array arguments; returns (gate, weight) arrays.
+    Uses the domain's vectorized evaluator if registered, else `evaluate` per point."""
+    import numpy as np
+    if domain not in _REGISTRY:
+        raise KeyError(f"No linear-response evaluator registered for domain '{domain}'")
+    if domain in _MANY:
+        gate, weight = _MANY[domain](**kwargs)
+        return np.asarray(gate, dtype=bool), np.asarray(weight, dtype=float)
+    keys = list(kwargs)
+    arrs = np.broadcast_arrays(*(np.asarray(kwargs[k]) for k in keys))
+    shape = arrs[0].shape if arrs else ()
+    gate, weight = np.zeros(shape, dtype=bool), np.zeros(shape, dtype=float)
+    for i in np.ndindex(shape):
+        gate[i], weight[i] = _REGISTRY[domain](**{k: a[i].item() for k, a in zip(keys, arrs)})
+    return gate, weight
+
 # --- GW VBK specialization ---
 def _gw_vbk_adapter(**kwargs):
     from mpfst.domains.gw_superradiance import BHParams, evaluate_gate_and_weight
@@ -30,19 +53,38 @@ def _gw_vbk_adapter(**kwargs):
     C = kwargs.get('C', 1.0)
     return evaluate_gate_and_weight(p, C=C)
 
-register('gw_vbk', _gw_vbk_adapter)
+def _gw_vbk_many(M, a, Q=0.0, m=1, q=0.0, mu=0.0, C=1.0):
+    from mpfst.domains.gw_superradiance import gate_grid
+    r = gate_grid(M, a, Q, m, q, mu, C)
+    return r["gate"], r["weight"]
+
+register('gw_vbk', _gw_vbk_adapter, many=_gw_vbk_many)
 
 # Simple CLI for scripting
 def gw_vbk_cli():
     import argparse, json
     ap = argparse.ArgumentParser(description="Linear-response gate (GW VBK specialization)")
-    ap.add_argument("--M", type=float, required=True)
-    ap.add_argument("--a", type=float, required=True)
+    ap.add_argument("--M", type=float)
+    ap.add_argument("--a", type=float)
     ap.add_argument("--Q", type=float, default=0.0)
     ap.add_argument("--m", type=int, default=1)
     ap.add_argument("--q", type=float, default=0.0)
-    ap.add_argument("--mu", type=float, required=True)
+    ap.add_argument("--mu", type=str, required=True, help="Value, or start:stop:num grid with --catalog")
     ap.add_argument("--C", type=float, default=1.0)
+    ap.add_argument("--catalog", help="Cached GWOSC catalog JSON (file or directory) for batch mode")
+    ap.add_argument("--out", default="vbk_catalog.csv", help="Batch results table (.csv/.parquet/.npz)")
+    ap.add_argument("--workers", type=int, default=None)
     args = ap.parse_args()
-    gate, weight = evaluate('gw_vbk', M=args.M, a=args.a, Q=args.Q, m=args.m, q=args.q, mu=args.mu, C=args.C)
+    if args.catalog:
+        import numpy as np
+        from mpfst.domains.gw_catalog import load_catalog, evaluate_catalog, write_table
+        parts = args.mu.split(":")
+        mu = np.linspace(float(parts[0]), float(parts[1]), int(parts[2])) if len(parts)==3 else [float(args.mu)]
+        table = evaluate_catalog(load_catalog(args.catalog), mu, Q=args.Q, m=args.m, q=args.q, C=args.C, workers=args.workers)
+        write_table(table, args.out)
+        print(json.dumps({"events": int(len(set(table["event"]))), "rows": int(len(table["gate"])),
+                          "open": int(table["gate"].sum()), "out": args.out}))
+        return
+    if args.M is None or args.a is None: ap.error("--M and --a are required without --catalog")
+    gate, weight = evaluate('gw_vbk', M=args.M, a=args.a, Q=args.Q, m=args.m, q=args.q, mu=float(args.mu), C=args.C)
     print(json.dumps({"gate": gate, "weight": weight}))
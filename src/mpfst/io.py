@@ -0,0 +1,152 @@
+"""Signal I/O: one container for samples + sampling metadata, memory-mapped where possible.
+
+Formats (by suffix):
+  .npy    samples memory-mapped; metadata in a `<file>.json` sidecar
+  .npz    uncompressed archive with `samples` (memory-mapped in place) and
+          `fs`, `t0`, `channels` entries
+  .mseed  MiniSEED via ObsPy (optional dependency), one channel per trace
+  .csv    column `x` (or every numeric column but `t`/`fs`); fs from --fs,
+          an `fs` column or the spacing of a `t` column
+"""
+from __future__ import annotations
+import json, zipfile
+from dataclasses import dataclass
+from pathlib import Path
+import numpy as np
+from .trace import traced, span
+
+MSEED_SUFFIXES = (".mseed", ".miniseed", ".ms")
+
+@dataclass
+class Signal:
+    samples: np.ndarray              # (n_samples,) or (n_channels, n_samples)
+    fs: float                        # sampling rate [Hz]
+    t0: float = 0.0                  # start time [s] (POSIX time for MiniSEED)
+    channels: list[str] | None = None
+
+    @property
+    def n_samples(self) -> int:
+        return self.samples.shape[-1]
+
+    @property
+    def n_channels(self) -> int:
+        return 1 if self.samples.ndim==1 else self.samples.shape[0]
+
+    @property
+    def duration(self) -> float:
+        return self.n_samples / self.fs
+
+    def times(self) -> np.ndarray:
+        return self.t0 + np.arange(self.n_samples) / self.fs
+
+    def channel(self, key=0) -> np.ndarray:
+        """1-D samples of one channel, by index or name."""
+        if self.samples.ndim==1: return self.samples
+        if isinstance(key, str):
+            if not self.channels or key not in self.channels: raise KeyError(f"No channel '{key}'")
+            key = self.channels.index(key)
+        return self.samples[int(key)]
+
+    def chunks(self, size: int, overlap: int=0, drop_last: bool=False):
+        return iter_chunks(self.samples, size, overlap, drop_last)
+
+def iter_chunks(x, size: int, overlap: int=0, drop_last: bool=False):
+    """Yield (start, view) over the last axis in chunks of `size` samples that overlap by
+    `overlap`; views of a memory map stay lazy. The final chunk may be short unless drop_last."""
+    if not 0 <= overlap < size: raise ValueError("need 0 <= overlap < size")
+    n = x.shape[-1]; step = size - overlap
+    for s in range(0, max(n - overlap, 1), step):
+        if drop_last and s + size > n: break
+        yield s, x[..., s:s+size]
+
+def _npz_member_memmap(path, name):
+    """Memory-map a stored (uncompressed) .npy member of an .npz in place; None if not possible."""
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+        if info.compress_type != zipfile.ZIP_STORED: return None
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        local = f.read(30)
+        offset = info.header_offset + 30 + int.from_bytes(local[26:28], "little") + int.from_bytes(local[28:30], "little")
+        f.seek(offset)
+        version = np.lib.format.read_magic(f)
+        if version not in ((1, 0), (2, 0)): return None
+        read_header = np.lib.format.read_array_header_1_0 if version==(1, 0) else np.lib.format.read_array_header_2_0
+        shape, fortran, dtype = read_header(f)
+        data_offset = f.tell()
+    if dtype.hasobject: return None
+    return np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=shape, order="F" if fortran else "C")
+
+def _meta(fs, t0, channels, path):
+    if fs is None: raise ValueError(f"{path}: sampling rate unknown; pass fs")
+    return float(fs), float(t0), (list(channels) if channels is not None else None)
+
+@traced
+def read_signal(path, fs: float|None=None, mmap: bool=True, columns=None) -> Signal:
+    """Load a Signal from .npy/.npz/MiniSEED/.csv (see module docstring). `fs` overrides stored metadata."""
+    path = Path(path); suffix = path.suffix.lower()
+    if suffix==".npy":
+        x = np.load(path, mmap_mode="r" if mmap else None)
+        side = Path(str(path)+".json")
+        meta = json.loads(side.read_text()) if side.exists() else {}
+        return Signal(x, *_meta(fs or meta.get("fs"), meta.get("t0", 0.0), meta.get("channels"), path))
+    if suffix==".npz":
+        with np.load(path, allow_pickle=False) as z:
+            meta = {k: z[k] for k in ("fs", "t0", "channels") if k in z.files}
+            x = (_npz_member_memmap(path, "samples.npy") if mmap else None)
+            if x is None: x = z["samples"]
+        ch = meta.get("channels"); ch = [str(c) for c in ch] if ch is not None else None
+        return Signal(x, *_meta(fs or (float(meta["fs"]) if "fs" in meta else None), float(meta.get("t0", 0.0)), ch, path))
+    if suffix in MSEED_SUFFIXES:
+        try:
+            import obspy
+        except ImportError as e:
+            raise ImportError("Reading MiniSEED requires obspy (python -m pip install obspy)") from e
+        st = obspy.read(str(path)); st.merge(method=1, fill_value="interpolate")
+        n = min(len(tr.data) for tr in st)
+        x = np.stack([tr.data[:n].astype(float) for tr in st])
+        rate = fs or float(st[0].stats.sampling_rate)
+        return Signal(x[0] if len(st)==1 else x, rate, float(st[0].stats.starttime.timestamp), [tr.id for tr in st])
+    import pandas as pd
+    with span("pandas.read_csv"): df = pd.read_csv(path)
+    if columns is None: columns = ["x"] if "x" in df else [c for c in df.select_dtypes("number") if c not in ("t", "fs")]
+    x = df[list(columns)].to_numpy(dtype=float).T
+    t0 = 0.0
+    if fs is None and "fs" in df: fs = float(df["fs"].iloc[0])
+    if "t" in df:
+        t0 = float(df["t"].iloc[0])
+        if fs is None and len(df) > 1: fs = 1.0 / float(np.median(np.diff(df["t"].to_numpy(dtype=float))))
+    return Signal(x[0] if len(columns)==1 else x, *_meta(fs, t0, columns, path))
+
+def write_signal(sig: Signal, path):
+    """Write a Signal as .npy (+ .json sidecar), uncompressed .npz, or .csv."""
+    path = Path(path); suffix = path.suffix.lower()
+    if suffix==".npy":
+        np.save(path, np.asarray(sig.samples))
+        Path(str(path)+".json").write_text(json.dumps({"fs": sig.fs, "t0": sig.t0, "channels": sig.channels}))
+    elif suffix==".npz":
+        extra = {} if sig.channels is None else {"channels": np.array(sig.channels, dtype=str)}
+        np.savez(path, samples=np.asarray(sig.samples), fs=sig.fs, t0=sig.t0, **extra)
+    elif suffix==".csv":
+        import pandas as pd
+        x = np.atleast_2d(np.asarray(sig.samples))
+        names = sig.channels or (["x"] if x.shape[0]==1 else [f"ch{i}" for i in range(x.shape[0])])
+        df = pd.DataFrame(dict(zip(names, x)))
+        df.insert(0, "t", sig.times())
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unsupported signal format '{suffix}'")
+
+def add_input_args(ap, fs_required: bool=False):
+    """Shared CLI options: --input (alias --csv), --fs, --channel."""
+    ap.add_argument("--input", "--csv", dest="input", required=True,
+                    help="Signal file: .csv (column x), .npy, .npz or MiniSEED")
+    ap.add_argument("--fs", type=float, default=None, required=fs_required,
+                    help="Sampling rate [Hz]; optional when the file carries it")
+    ap.add_argument("--channel", default="0", help="Channel index or name for multi-channel inputs")
+
+def signal_from_args(args):
+    """(1-D samples, fs) for the CLI options added by `add_input_args`."""
+    sig = read_signal(args.input, fs=args.fs)
+    ch = int(args.channel) if str(args.channel).lstrip("-").isdigit() else args.channel
+    return np.asarray(sig.channel(ch), dtype=float), sig.fs
@@ -1,5 +1,9 @@
 import numpy as np
+from ..cache import memoize
+from ..trace import traced
 
+@traced
+@memoize(seeded=("seed",))
 def phase_randomize(x: np.ndarray, seed: int|None=None) -> np.ndarray:
     rng = np.random.default_rng(seed)
     X = np.fft.rfft(x)
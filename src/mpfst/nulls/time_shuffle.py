@@ -1,8 +1,90 @@
 import numpy as np
+from ..cache import memoize
+from ..trace import traced
 
-def time_shuffle(x: np.ndarray, block: int=256, seed: int|None=None) -> np.ndarray:
-    rng = np.random.default_rng(seed)
+BLOCK_METHODS = ("shuffle", "circular", "stationary")
+
+def _ranges(starts, lens, n, wrap=True):
+    """Concatenate [s, s+l) for each (s, l), wrapped modulo n."""
+    dt = np.int32 if 2*n < 2**31 else np.int64
+    starts = starts.astype(dt); lens = lens.astype(dt)
+    idx = np.repeat(starts - (np.cumsum(lens) - lens), lens)
+    idx += np.arange(len(idx), dtype=dt)
+    if wrap: np.subtract(idx, n, out=idx, where=idx>=n)
+    return idx
+
+def _rng(seed):
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+def block_indices(n: int, block: int=256, seed=None, method: str="shuffle") -> np.ndarray:
+    """Index map idx (n,) such that x[idx] is a block surrogate of x.
+
+    method="shuffle" permutes the fixed blocks [0,block), [block,2·block), ... and
+    reproduces `time_shuffle` for the same seed; "circular" draws fixed-length
+    blocks at random start points of the wrapped series; "stationary" does the
+    same with geometric block lengths of mean `block` (Politis–Romano).
+    """
+    rng = _rng(seed)
+    if method=="shuffle":
+        starts = np.arange(0, n, block)
+        perm = rng.permutation(len(starts))
+        return _ranges(starts[perm], np.minimum(block, n - starts)[perm], n, wrap=False)
+    if method=="circular":
+        nb = -(-n // block)
+        return _ranges(rng.integers(0, n, nb), np.full(nb, block), n)[:n]
+    if method=="stationary":
+        lens = rng.geometric(1.0/block, size=2*(n//block)+8)
+        while lens.sum() < n:
+            lens = np.concatenate([lens, rng.geometric(1.0/block, size=len(lens))])
+        nb = int(np.searchsorted(np.cumsum(lens), n)) + 1
+        return _ranges(rng.integers(0, n, nb), lens[:nb], n)[:n]
+    raise ValueError(f"Unknown block method '{method}'")
+
+def _shuffle_into(x, block, perm, out):
+    """Write the permuted fixed blocks of x into out as whole-block copies.
+    Only the last block can be short, so output is full blocks / short block / full blocks.
+    """
+    n = len(x); nf = n // block; rest = x.shape[1:]
+    xr = x[:nf*block].reshape((nf, block)+rest)
+    p = int(np.flatnonzero(perm==nf)[0]) if nf < len(perm) else len(perm)
+    np.take(xr, perm[:p], axis=0, out=out[:p*block].reshape((p, block)+rest))
+    if p < len(perm):
+        tail = n - nf*block
+        out[p*block:p*block+tail] = x[nf*block:]
+        after = perm[p+1:]
+        np.take(xr, after, axis=0, out=out[p*block+tail:].reshape((len(after), block)+rest))
+    return out
+
+def block_surrogate(x: np.ndarray, block: int=256, seed=None, method: str="shuffle",
+                    out: np.ndarray|None=None) -> np.ndarray:
+    """One block surrogate of x (along axis 0), written into `out` if given."""
+    x = np.asarray(x)
+    if out is None: out = np.empty_like(x)
+    if method=="shuffle" and out.flags.c_contiguous:
+        return _shuffle_into(x, block, _rng(seed).permutation(-(-len(x) // block)), out)
+    return np.take(x, block_indices(len(x), block, seed, method), axis=0, out=out)
+
+@traced
+@memoize(bypass=("out",), seeded=("seed",))
+def block_surrogates(x: np.ndarray, n_surrogates: int, block: int=256, seed=None, method: str="shuffle",
+                     out: np.ndarray|None=None, indices_only: bool=False) -> np.ndarray:
+    """Batch of block surrogates, shape (n_surrogates, len(x)), written into `out` if given.
+
+    Surrogate i uses the i-th child of SeedSequence(seed), so with method="shuffle"
+    row i equals time_shuffle(x, block, seed=child_i). With indices_only the
+    (n_surrogates, n) index map is returned instead, for lazy gathering.
+    """
+    x = np.asarray(x)
     n = len(x)
-    blocks = [x[i:i+block] for i in range(0, n, block)]
-    rng.shuffle(blocks)
-    return np.concatenate(blocks)[:n]
+    seeds = np.random.SeedSequence(seed).spawn(n_surrogates)
+    if indices_only:
+        idx = np.empty((n_surrogates, n), dtype=np.int32 if 2*n < 2**31 else np.int64)
+        for i, s in enumerate(seeds): idx[i] = block_indices(n, block, s, method)
+        return idx
+    if out is None: out = np.empty((n_surrogates,)+x.shape, dtype=x.dtype)
+    for i, s in enumerate(seeds):
+        block_surrogate(x, block, s, method, out=out[i])
+    return out
+
+def time_shuffle(x: np.ndarray, block: int=256, seed: int|None=None) -> np.ndarray:
+    return block_surrogate(x, block, seed, method="shuffle")
@@ -0,0 +1,239 @@
+"""Manifest-driven study runner.
+
+Each study in `replication_manifest.yaml` expands into a DAG of stages:
+
+    load ─┬─ metrics ─────────────┐
+          ├─ ssm ─────────────────┼─ stats
+          └─ nulls/<method>/<i> ──┘        (one task per surrogate batch)
+    entrypoint                             (module:function CLI; skipped without `args`)
+
+Stages run in a process pool as soon as their inputs exist. Each stage writes
+its output to `<out>/<study>/<stage>-<key>.pkl` (atomically), where the key
+hashes the study's configuration and the contents of the stage's input
+checkpoints, so an interrupted run resumes from the stages already on disk,
+while a changed configuration or a changed upstream result recomputes
+everything below it. `report.json` and `report.md` give per-stage status,
+wall time and peak traced memory; an entrypoint without `args` is listed as
+skipped.
+
+Study keys (all optional except where noted):
+    input: signal file (see mpfst.io)   fs: sampling rate if not stored
+    window / hop: rolling mℓ in samples  ssm: {fmin, fmax, bands, backend}
+    nulls: [phase_randomize | time_shuffle | aaft | iaaft]
+    n_surrogates (200), batch (50), block (256), seed (0), alpha (0.05)
+    entrypoint: module:function          args: [CLI arguments]
+"""
+from __future__ import annotations
+import hashlib, json, os, pickle, time, tracemalloc
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+import numpy as np
+
+NULL_METHODS = {"phase_randomize": "phase", "time_shuffle": "block", "aaft": "aaft", "iaaft": "iaaft"}
+
+def load_manifest(path) -> dict:
+    import yaml
+    with open(path) as f: return yaml.safe_load(f) or {}
+
+def _key(cfg) -> str:
+    return hashlib.blake2b(json.dumps(cfg, sort_keys=True, default=str).encode(), digest_size=6).hexdigest()
+
+def _digest(path) -> str:
+    with open(path, "rb") as f: return hashlib.blake2b(f.read(), digest_size=6).hexdigest()
+
+def plan(name: str, cfg: dict) -> dict:
+    """{stage: [dependencies]} for one study."""
+    dag = {}
+    if cfg.get("entrypoint"):
+        dag["entrypoint"] = []
+    if cfg.get("input"):
+        dag["load"] = []; dag["metrics"] = ["load"]; dag["ssm"] = ["load"]
+        batches = []
+        n, b = int(cfg.get("n_surrogates", 200)), int(cfg.get("batch", 50))
+        for method in cfg.get("nulls", []) or []:
+            if method not in NULL_METHODS: raise ValueError(f"{name}: unknown null '{method}'")
+            for i in range(0, n, b):
+                dag[f"nulls/{method}/{i}"] = ["load"]; batches.append(f"nulls/{method}/{i}")
+        dag["stats"] = ["metrics", "ssm"] + batches
+    return dag
+
+# --- stage implementations (module level so they pickle into workers) ---
+def _ssm_params(cfg, fs):
+    p = dict(cfg.get("ssm") or {})
+    bands = int(p.get("bands", 6)); fmax = float(p.get("fmax", 0.45*fs))
+    return {"fmin": float(p.get("fmin", fmax / 2**bands)), "fmax": fmax, "n_bands": bands,
+            "backend": p.get("backend", "fft")}
+
+def _whole_metrics(x, fs):
+    from mpfst.coherence.metrics import spectral_slope_gamma, hurst_dfa, heavy_tail_mu_hill
+    from mpfst.coherence.meter import compute_m_l
+    mu, gamma, H = heavy_tail_mu_hill(x), spectral_slope_gamma(x, fs=fs), hurst_dfa(x)
+    return {"mu": mu, "gamma": gamma, "H": H, "m_l": compute_m_l(mu, gamma, H)}
+
+def _n_jumps(x, fs, p):
+    from mpfst.spectral.octave_jump import detect_shell_jumps_series
+    return len(detect_shell_jumps_series(x, fs, **p)["jumps"])
+
+def _stage_load(cfg, deps, study_dir):
+    from mpfst.io import read_signal, write_signal, Signal
+    sig = read_signal(cfg["input"], fs=cfg.get("fs"))
+    path = study_dir / f"signal-{_key(cfg)}.npz"
+    write_signal(Signal(np.asarray(sig.channel(cfg.get("channel", 0)), dtype=float), sig.fs, sig.t0), path)
+    return {"path": str(path), "fs": sig.fs, "n": sig.n_samples}
+
+def _signal(deps):
+    from mpfst.io import read_signal
+    sig = read_signal(deps["load"]["path"])
+    return np.asarray(sig.samples), sig.fs
+
+def _stage_metrics(cfg, deps, study_dir):
+    x, fs = _signal(deps)
+    out = _whole_metrics(x, fs)
+    if cfg.get("window"):
+        from mpfst.coherence.rolling import rolling_coherence
+        win = int(cfg["window"])
+        out["rolling"] = rolling_coherence(x, fs, win, int(cfg.get("hop", win//2)))
+    return out
+
+def _stage_ssm(cfg, deps, study_dir):
+    from mpfst.spectral.octave_jump import detect_shell_jumps_series
+    x, fs = _signal(deps)
+    return detect_shell_jumps_series(x, fs, **_ssm_params(cfg, fs))
+
+def _stage_nulls(cfg, deps, study_dir, method, start):
+    from mpfst.nulls.ensemble import _Source, surrogate_seeds
+    from mpfst.nulls.time_shuffle import time_shuffle
+    x, fs = _signal(deps)
+    n, b = int(cfg.get("n_surrogates", 200)), int(cfg.get("batch", 50))
+    seeds = surrogate_seeds([int(cfg.get("seed", 0)), list(NULL_METHODS).index(method)], n)[start:start+b]
+    kind = NULL_METHODS[method]
+    Y = (np.stack([time_shuffle(x, int(cfg.get("block", 256)), s) for s in seeds]) if kind=="block"
+         else _Source(x, kind).batch(seeds))
+    p = _ssm_params(cfg, fs)
+    return {"m_l": np.array([_whole_metrics(y, fs)["m_l"] for y in Y]),
+            "n_jumps": np.array([_n_jumps(y, fs, p) for y in Y], dtype=float)}
+
+def _stage_stats(cfg, deps, study_dir):
+    from mpfst.nulls.ensemble import _p_value
+    from mpfst.stats.fdr import bh_adjust
+    obs = {"m_l": deps["metrics"]["m_l"], "n_jumps": float(len(deps["ssm"]["jumps"]))}
+    tests = []
+    for method in cfg.get("nulls", []) or []:
+        parts = [v for k, v in deps.items() if k.startswith(f"nulls/{method}/")]
+        for stat, o in obs.items():
+            null = np.concatenate([p[stat] for p in parts])
+            tests.append({"null": method, "statistic": stat, "observed": o, "n": len(null),
+                          "null_mean": float(np.nanmean(null)), "p_value": _p_value(o, null, "greater")})
+    q = bh_adjust([t["p_value"] for t in tests]) if tests else []
+    alpha = float(cfg.get("alpha", 0.05))
+    for t, qi in zip(tests, q): t["q_value"] = float(qi); t["reject"] = bool(qi <= alpha)
+    return {"observed": obs, "tests": tests}
+
+def _stage_entrypoint(cfg, deps, study_dir):
+    import contextlib, io, sys
+    from importlib import import_module
+    module, func = cfg["entrypoint"].split(":")
+    buf, saved = io.StringIO(), sys.argv
+    sys.argv = [cfg["entrypoint"]] + [str(a) for a in cfg["args"]]
+    try:
+        with contextlib.redirect_stdout(buf): getattr(import_module(module), func)()
+    finally:
+        sys.argv = saved
+    return {"stdout": buf.getvalue()}
+
+_STAGE_MODULES = ("mpfst.io", "mpfst.coherence.metrics", "mpfst.coherence.meter", "mpfst.coherence.rolling",
+                  "mpfst.spectral.octave_jump", "mpfst.nulls.ensemble", "mpfst.nulls.time_shuffle", "mpfst.stats.fdr")
+
+def _execute(stage, cfg, dep_paths, study_dir, ckpt):
+    """Run one stage in a worker: read inputs, compute, write the checkpoint atomically."""
+    from importlib import import_module
+    for m in _STAGE_MODULES: import_module(m)   # import outside the traced region
+    deps = {}
+    for d, p in dep_paths.items():
+        with open(p, "rb") as f: deps[d] = pickle.load(f)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    if stage.startswith("nulls/"):
+        _, method, start = stage.split("/")
+        out = _stage_nulls(cfg, deps, study_dir, method, int(start))
+    else:
+        out = globals()[f"_stage_{stage}"](cfg, deps, study_dir)
+    wall = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]; tracemalloc.stop()
+    tmp = f"{ckpt}.tmp-{os.getpid()}"
+    with open(tmp, "wb") as f: pickle.dump(out, f)
+    os.replace(tmp, ckpt)
+    return {"wall_s": wall, "peak_mb": peak / 2**20}
+
+def run(manifest, out="runs", studies=None, workers=None) -> dict:
+    """Run (or resume) the manifest's studies; returns and writes the stage report."""
+    base = Path(".")
+    if not isinstance(manifest, dict):
+        base = Path(manifest).parent; manifest = load_manifest(manifest)
+    out = Path(out); out.mkdir(parents=True, exist_ok=True)
+    tasks, ckpt, keys, report = {}, {}, {}, {}
+    for name, cfg in (manifest.get("studies") or {}).items():
+        if studies and name not in studies: continue
+        cfg = dict(cfg or {})
+        if cfg.get("input"): cfg["input"] = str(base / cfg["input"])   # relative to the manifest
+        keys[name] = _key(cfg)
+        (out/name).mkdir(exist_ok=True)
+        for stage, deps in plan(name, cfg).items():
+            tasks[(name, stage)] = (cfg, [(name, d) for d in deps])
+            if stage == "entrypoint" and cfg.get("args") is None:
+                report[(name, stage)] = {"status": "skipped", "reason": "no args in manifest"}
+    pending = {t for t in tasks if t not in report}
+    running = {}
+    with ProcessPoolExecutor(workers or os.cpu_count()) as ex:
+        while pending or running:
+            ready = True
+            while ready:   # cached stages unlock their dependents without a pool round trip
+                ready = False
+                for tid in sorted(pending):
+                    cfg, deps = tasks[tid]
+                    if any(report.get(d, {}).get("status") in ("failed", "skipped") for d in deps):
+                        report[tid] = {"status": "skipped"}; pending.discard(tid); continue
+                    if not all(report.get(d, {}).get("status") in ("done", "cached") for d in deps): continue
+                    pending.discard(tid)
+                    key = _key([keys[tid[0]], [_digest(ckpt[d]) for d in deps]]) if deps else keys[tid[0]]
+                    ckpt[tid] = out/tid[0]/f"{tid[1].replace('/', '_')}-{key}.pkl"
+                    if ckpt[tid].exists():
+                        report[tid] = {"status": "cached"}; ready = True; continue
+                    fut = ex.submit(_execute, tid[1], cfg, {d[1]: str(ckpt[d]) for d in deps},
+                                    out/tid[0], str(ckpt[tid]))
+                    running[fut] = (tid, time.perf_counter())
+            if not running: break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                tid, t0 = running.pop(fut)
+                try:
+                    report[tid] = dict(status="done", **fut.result())
+                except Exception as e:
+                    report[tid] = {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+                report[tid]["elapsed_s"] = time.perf_counter() - t0
+    rows = [dict(study=s, stage=g, **report.get((s, g), {"status": "skipped"})) for s, g in tasks]
+    results = {}
+    for s, g in tasks:
+        if g in ("stats", "entrypoint") and (s, g) in ckpt and ckpt[(s, g)].exists():
+            with open(ckpt[(s, g)], "rb") as f: results.setdefault(s, {})[g] = pickle.load(f)
+    rep = {"stages": rows, "results": results}
+    (out/"report.json").write_text(json.dumps(rep, indent=2, default=float))
+    lines = ["| study | stage | status | wall s | peak MB |", "|---|---|---|---|---|"]
+    lines += [f"| {r['study']} | {r['stage']} | {r['status']} | {r.get('wall_s', float('nan')):.3f} | "
+              f"{r.get('peak_mb', float('nan')):.1f} |" for r in rows]
+    (out/"report.md").write_text("\n".join(lines) + "\n")
+    return rep
+
+def runner_cli():
+    import argparse
+    ap = argparse.ArgumentParser(description="Run the replication manifest as a parallel, resumable stage DAG")
+    ap.add_argument("--manifest", default="replication_manifest.yaml")
+    ap.add_argument("--out", default="runs")
+    ap.add_argument("--study", action="append", help="Only these studies (repeatable)")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+    rep = run(args.manifest, args.out, args.study, args.workers)
+    counts = {}
+    for r in rep["stages"]: counts[r["status"]] = counts.get(r["status"], 0) + 1
+    print(json.dumps({"out": args.out, **counts}))
+    print((Path(args.out)/"report.md").read_text(), end="")
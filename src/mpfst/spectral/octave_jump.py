@@ -1,28 +1,56 @@
 import argparse, json, numpy as np
-from .utils import octave_band_edges, filterbank_energy
+from .utils import octave_band_edges, filterbank_energy, framed_filterbank_energy
 from .ssm import dominant_shell_indices, detect_shell_jumps
+from ..trace import traced
 
-def detect_shell_jumps_series(x, fs, fmin, fmax, n_bands=8, energy_min=None, min_gap=1):
+@traced
+def detect_shell_jumps_series(x, fs, fmin, fmax, n_bands=8, energy_min=None, min_gap=1,
+                              backend="butter", rolloff=0.1, frame=None, hop=None, frame_unit="samples",
+                              dtype=np.float64):
+    """Octave shell-jumps of x. With `frame` (and optional `hop`, in samples or
+    seconds per `frame_unit`) band energies and dominant shells are computed per
+    frame; jump times are still reported in samples (frame centres) and
+    `min_gap` stays in samples.
+    """
     edges = octave_band_edges(fmin, fmax, n_bands)
-    E = filterbank_energy(np.asarray(x), fs, edges)
+    if frame is None:
+        E = filterbank_energy(np.asarray(x), fs, edges, backend=backend, rolloff=rolloff)
+        dom = dominant_shell_indices(E, energy_min=energy_min)
+        jumps = detect_shell_jumps(dom, edges, min_gap=min_gap)
+        return {"edges": edges.tolist(), "jumps": jumps}
+    if frame_unit=="seconds":
+        frame = int(round(frame*fs)); hop = None if hop is None else int(round(hop*fs))
+    elif frame_unit!="samples":
+        raise ValueError("frame_unit must be 'samples' or 'seconds'")
+    frame = max(1, int(frame)); hop = frame if hop is None else max(1, int(hop))
+    E, starts = framed_filterbank_energy(np.asarray(x), fs, edges, frame, hop,
+                                         backend=backend, rolloff=rolloff, dtype=dtype)
     dom = dominant_shell_indices(E, energy_min=energy_min)
-    jumps = detect_shell_jumps(dom, edges, min_gap=min_gap)
+    jumps = detect_shell_jumps(dom, edges, min_gap=-(-min_gap // hop))
+    centre = starts + frame//2
+    jumps = [(int(centre[t]), k0, k1, d) for t, k0, k1, d in jumps]
     return {"edges": edges.tolist(), "jumps": jumps}
 
 def detect_shell_jumps_cli():
+    from mpfst.io import add_input_args, signal_from_args
     ap = argparse.ArgumentParser()
-    ap.add_argument("--csv", required=True, help="CSV with 1D signal column 'x'")
-    ap.add_argument("--fs", type=float, required=True)
+    add_input_args(ap)
     ap.add_argument("--fmin", type=float, required=True)
     ap.add_argument("--fmax", type=float, required=True)
     ap.add_argument("--bands", type=int, default=8)
     ap.add_argument("--energy-min", type=float, default=None)
     ap.add_argument("--min-gap", type=int, default=1)
+    ap.add_argument("--backend", choices=["butter", "fft"], default="butter")
+    ap.add_argument("--rolloff", type=float, default=0.1, help="FFT backend band-edge roll-off (octaves)")
+    ap.add_argument("--frame", type=float, default=None, help="Frame length for framed mode (see --frame-unit)")
+    ap.add_argument("--hop", type=float, default=None, help="Frame hop (defaults to --frame)")
+    ap.add_argument("--frame-unit", choices=["samples", "seconds"], default="samples")
+    ap.add_argument("--float32", action="store_true", help="Store framed band energies as float32")
     args = ap.parse_args()
-    import pandas as pd
-    df = pd.read_csv(args.csv)
-    x = df["x"].values
-    out = detect_shell_jumps_series(x, args.fs, args.fmin, args.fmax,
+    x, fs = signal_from_args(args)
+    out = detect_shell_jumps_series(x, fs, args.fmin, args.fmax,
                                     n_bands=args.bands, energy_min=args.energy_min,
-                                    min_gap=args.min_gap)
+                                    min_gap=args.min_gap, backend=args.backend, rolloff=args.rolloff,
+                                    frame=args.frame, hop=args.hop, frame_unit=args.frame_unit,
+                                    dtype=np.float32 if args.float32 else np.float64)
     print(json.dumps(out))
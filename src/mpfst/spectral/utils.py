@@ -1,23 +1,104 @@
 import numpy as np
-from scipy.signal import butter, filtfilt, hilbert
+from scipy import fft as sfft
+from ..cache import memoize
+from ..trace import traced, span
 
 def octave_band_edges(fmin, fmax, n_bands):
     edges = [fmin*(2**i) for i in range(n_bands+1)]
     edges = [e for e in edges if e<=fmax*(1+1e-9)]
     return np.array(edges)
 
+@traced
 def band_envelope(x, fs, f_lo, f_hi, order=4):
+    from scipy.signal import butter, filtfilt, hilbert   # slow to import; only the butter path needs it
     ny = fs/2
     f_lo = max(1e-6, min(f_lo, ny*0.99))
     f_hi = max(f_lo*1.01, min(f_hi, ny*0.999))
     b,a = butter(order, [f_lo/ny, f_hi/ny], btype="band")
-    y = filtfilt(b,a,x)
-    env = np.abs(hilbert(y))
+    with span("scipy.filtfilt"): y = filtfilt(b,a,x)
+    with span("scipy.hilbert"): env = np.abs(hilbert(y))
     return env
 
-def filterbank_energy(x, fs, edges):
+def fft_band_masks(freqs, edges, rolloff=0.1):
+    """Zero-phase band masks (bands, len(freqs)) for the octave bands in `edges`.
+    Each edge gets a raised-cosine transition `rolloff` octaves wide, so adjacent
+    masks sum to one; rolloff=0 gives brick-wall bands.
+    """
+    lf = np.log2(np.maximum(freqs, 1e-300))
+    def step(e):  # 0 below edge e, 1 above, cosine ramp across it
+        st = (lf>=e).astype(float)
+        if rolloff>0:
+            ramp = np.abs(lf - e) < rolloff/2
+            st[ramp] = 0.5 - 0.5*np.cos(np.pi*((lf[ramp] - e)/rolloff + 0.5))
+        return st
+    steps = np.array([step(e) for e in np.log2(np.asarray(edges, dtype=float))])
+    M = steps[:-1] - steps[1:]
+    M[:, freqs<=0] = 0.0
+    return M
+
+@traced
+def fft_filterbank_energy(x, fs, edges, rolloff=0.1, workers=-1):
+    """Octave filterbank energy from one rfft and one batched inverse FFT.
+    Band masks are applied to the one-sided spectrum and doubled into analytic
+    signals, so every band's Hilbert envelope comes out of a single ifft call.
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.shape[-1]
+    X = sfft.rfft(x, workers=workers)
+    X[1:(n+1)//2] *= 2.0  # analytic signal: double positive frequencies; DC and (even-n) Nyquist stay single
+    M = fft_band_masks(sfft.rfftfreq(n, 1/fs), edges, rolloff)
+    Z = np.zeros((len(M), n), dtype=complex)
+    Z[:, :X.shape[-1]] = M*X
+    env = sfft.ifft(Z, axis=-1, overwrite_x=True, workers=workers)
+    return env.real**2 + env.imag**2  # shape: (bands, time)
+
+@traced
+@memoize
+def filterbank_energy(x, fs, edges, backend="butter", rolloff=0.1):
+    if backend=="fft":
+        return fft_filterbank_energy(x, fs, edges, rolloff=rolloff)
+    if backend!="butter": raise ValueError(f"Unknown filterbank backend '{backend}'")
     E = []
     for lo, hi in zip(edges[:-1], edges[1:]):
         env = band_envelope(x, fs, lo, hi)
         E.append(env**2)
     return np.array(E)  # shape: (bands, time)
+
+def frame_starts(n, frame, hop):
+    """Start samples of every full frame of length `frame` every `hop` samples."""
+    return np.arange(0, max(n-frame, -1)+1, hop)
+
+def _frame_means(v, frame, hop):
+    """Per-frame means, each summed over its own frame (a global cumsum loses
+    small frames after a large burst)."""
+    s = frame_starts(len(v), frame, hop)
+    if len(s) == 0: return np.empty(0)
+    if hop == frame: return v[:len(s)*frame].reshape(-1, frame).mean(axis=1)
+    idx = np.stack([s, s+frame], axis=1).ravel()
+    return np.add.reduceat(np.append(v, 0.0), idx)[::2] / frame
+
+@traced
+@memoize
+def framed_filterbank_energy(x, fs, edges, frame, hop=None, backend="butter", rolloff=0.1, dtype=np.float64):
+    """Mean band energy per frame, shape (bands, frames), plus frame start samples.
+    Bands are filtered one at a time and reduced to frames immediately, so the
+    full-resolution (bands, time) matrix is never held.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x); hop = frame if hop is None else hop
+    starts = frame_starts(n, frame, hop)
+    E = np.empty((len(edges)-1, len(starts)), dtype=dtype)
+    if backend=="fft":
+        X = sfft.rfft(x)
+        X[1:(n+1)//2] *= 2.0
+        M = fft_band_masks(sfft.rfftfreq(n, 1/fs), edges, rolloff)
+        for i, m in enumerate(M):
+            Z = np.zeros(n, dtype=complex); Z[:len(X)] = m*X
+            env = sfft.ifft(Z, overwrite_x=True)
+            E[i] = _frame_means(env.real**2 + env.imag**2, frame, hop)
+    elif backend=="butter":
+        for i, (lo, hi) in enumerate(zip(edges[:-1], edges[1:])):
+            E[i] = _frame_means(band_envelope(x, fs, lo, hi)**2, frame, hop)
+    else:
+        raise ValueError(f"Unknown filterbank backend '{backend}'")
+    return E, starts
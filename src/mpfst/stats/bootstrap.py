@@ -1,8 +1,76 @@
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 import numpy as np
+from ..trace import traced
 
-def ci_mean(x, alpha=0.05, n_boot=2000, seed=None):
+_BLOCK_BYTES = 2**22   # indices + gathered values reduced at a time (cache-sized)
+
+@traced
+def ci_mean(x, alpha=0.05, n_boot=2000, seed=None, workers: int|None=None, max_bytes: int=2**26):
+    """Percentile bootstrap CI of the mean; `bootstrap(x, np.mean, ...)["ci"]`.
+
+    Expected speedup over the former per-resample `rng.choice` loop on one
+    core: ~15x at n=1e2, ~4x at n=1e3, but only ~1x at n=1e4-1e5, where
+    drawing the n·n_boot random indices dominates and vectorizing removes
+    nothing. Beyond that the gain has to come from `workers`, which spread
+    the chunks over processes without changing the result;
+    `benchmarks/bench_suite.py --cases ci_mean ci_mean_workers ci_mean_loop`
+    records both ratios. The random stream differs from that loop, so a given
+    seed gives a different interval than it did before.
+    """
+    return bootstrap(x, np.mean, n_boot, alpha, seed=seed, max_bytes=max_bytes, workers=workers)["ci"]
+
+# --- chunked, vectorized bootstrap engine ---
+def _resample_chunk(x, statistic, rows, seed):
+    """statistic over `rows` resamples of x, drawn and reduced in blocks of at
+    most _BLOCK_BYTES so the gathered values stay in cache."""
     rng = np.random.default_rng(seed)
+    n = len(x)
+    step = max(1, _BLOCK_BYTES // (16*max(1, n)))   # intp indices + gathered values
+    out = np.empty(rows)
+    for i in range(0, rows, step):
+        idx = rng.integers(0, n, size=(min(step, rows-i), n))
+        out[i:i+len(idx)] = statistic(np.take(x, idx), axis=-1)
+    return out
+
+def _jackknife(x, statistic, groups):
+    """Leave-one-out (or, for len(x) > groups, delete-a-group) replicates of the statistic."""
+    n = len(x)
+    g = np.array_split(np.arange(n), min(n, groups))
+    return np.array([float(statistic(np.delete(x, gi), axis=-1)) for gi in g])
+
+@traced
+def bootstrap(x, statistic=np.mean, n_boot: int=2000, alpha: float=0.05, method: str="percentile",
+              seed=None, max_bytes: int=2**26, workers: int|None=None, jackknife_groups: int=1000) -> dict:
+    """Bootstrap CI of `statistic` (called as statistic(a, axis=-1)) for the 1-D sample x.
+
+    Resample indices are drawn in chunks of at most `max_bytes` and each chunk
+    is reduced in one call. Chunk k uses the k-th child of SeedSequence(seed),
+    so results do not depend on `workers`. method is "percentile" or "bca".
+    Returns {"estimate", "ci": (lo, hi), "distribution"}.
+    """
+    if method not in ("percentile", "bca"): raise ValueError("method must be 'percentile' or 'bca'")
     x = np.asarray(x, dtype=float)
-    bs = [rng.choice(x, size=len(x), replace=True).mean() for _ in range(n_boot)]
-    lo, hi = np.quantile(bs, [alpha/2, 1-alpha/2])
-    return float(lo), float(hi)
+    rows = max(1, min(n_boot, max_bytes // (16*max(1, len(x)))))  # indices + gathered values
+    sizes = [min(rows, n_boot-i) for i in range(0, n_boot, rows)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers and workers > 1:
+        with ProcessPoolExecutor(workers) as ex:
+            parts = list(ex.map(_resample_chunk, [x]*len(sizes), [statistic]*len(sizes), sizes, seeds))
+    else:
+        parts = [_resample_chunk(x, statistic, r, s) for r, s in zip(sizes, seeds)]
+    dist = np.concatenate(parts)
+    est = float(statistic(x, axis=-1))
+    q = np.array([alpha/2, 1-alpha/2])
+    if method=="bca":
+        nd = NormalDist()
+        frac = (np.sum(dist < est) + 0.5*np.sum(dist == est)) / len(dist)
+        z0 = nd.inv_cdf(min(max(frac, 1e-12), 1-1e-12))
+        jk = _jackknife(x, statistic, jackknife_groups)
+        d = jk.mean() - jk
+        den = 6.0*np.sum(d**2)**1.5
+        a = np.sum(d**3)/den if den > 0 else 0.0
+        z = np.array([nd.inv_cdf(p) for p in q])
+        q = np.array([nd.cdf(z0 + (z0+zi)/(1 - a*(z0+zi))) for zi in z])
+    lo, hi = np.quantile(dist, q)
+    return {"estimate": est, "ci": (float(lo), float(hi)), "distribution": dist}
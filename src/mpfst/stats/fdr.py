@@ -1,4 +1,5 @@
 import numpy as np
+from ..trace import traced
 
 def bh_fdr(pvals, alpha=0.05):
     p = np.sort(np.asarray(pvals))
@@ -6,3 +7,170 @@ def bh_fdr(pvals, alpha=0.05):
     thresh = alpha * np.arange(1, m+1)/m
     k = np.where(p<=thresh)[0]
     return int(k.max()+1) if len(k)>0 else 0
+
+def _harmonic(m):
+    """c(m) = Σ_{i≤m} 1/i, the Benjamini–Yekutieli dependence correction."""
+    return float(np.sum(1.0/np.arange(1, m+1))) if m < 10**6 else float(np.log(m) + np.euler_gamma + 0.5/m)
+
+@traced
+def fdr_adjust(pvals, method="bh"):
+    """BH ("bh") or BY ("by") adjusted p-values (q-values), in the input order and shape.
+    Non-finite p-values (e.g. a NaN diagonal) are not tested: they get NaN and do not count in m."""
+    p = np.asarray(pvals, dtype=float)
+    if method not in ("bh", "by"): raise ValueError("method must be 'bh' or 'by'")
+    ok = np.isfinite(p.ravel())
+    flat = p.ravel()[ok]; m = flat.size
+    out = np.full(p.size, np.nan)
+    if m==0: return out.reshape(p.shape)
+    c = _harmonic(m) if method=="by" else 1.0
+    order = np.argsort(flat, kind="stable")
+    q = flat[order] * (c*m / np.arange(1, m+1))
+    q = np.minimum.accumulate(q[::-1])[::-1]   # step-up: q_(i) = min_{j≥i} c·m·p_(j)/j
+    qf = np.empty(m); qf[order] = np.minimum(q, 1.0)
+    out[ok] = qf
+    return out.reshape(p.shape)
+
+def bh_adjust(pvals):
+    return fdr_adjust(pvals, "bh")
+
+def by_adjust(pvals):
+    return fdr_adjust(pvals, "by")
+
+class StreamingFDR:
+    """Out-of-core BH/BY over p-values that arrive in chunks.
+
+    Pass 1 (`update`) histograms the p-values on fine log-spaced bins. That
+    brackets the BH threshold to a few bins; pass 2 (`refine`) keeps only the
+    p-values falling in those bins, which fixes the threshold exactly. Pass 3
+    (`reject`, `qvalues`) maps any chunk to decisions. Only the histogram and
+    the candidate p-values are held, never the full array. `qvalues` are
+    conservative at bin resolution (exact ordering would need the full array).
+    Non-finite p-values are skipped: they do not count in m, are never
+    rejected and get NaN q-values.
+    """
+    def __init__(self, alpha=0.05, method="bh", bins=2**16, pmin=1e-16):
+        if method not in ("bh", "by"): raise ValueError("method must be 'bh' or 'by'")
+        self.alpha, self.method = alpha, method
+        self.edges = np.concatenate([[0.0], np.geomspace(pmin, 1.0, bins)])
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.m = 0
+        self._cand, self._lo, self._hi = [], None, None
+        self._threshold = None
+
+    def _bin(self, p):
+        return np.clip(np.searchsorted(self.edges, p, side="right")-1, 0, len(self.counts)-1)
+
+    def update(self, pvals):
+        p = np.asarray(pvals, dtype=float).ravel()
+        p = p[np.isfinite(p)]
+        self.counts += np.bincount(self._bin(p), minlength=len(self.counts))
+        self.m += p.size
+        self._threshold = None
+        return self
+
+    @property
+    def level(self):
+        """Effective per-test level α/c(m) (c=1 for BH)."""
+        return self.alpha / (_harmonic(self.m) if self.method=="by" else 1.0)
+
+    def _candidate_bins(self):
+        C = np.cumsum(self.counts); lo = self.edges[:-1]; hi = np.append(self.edges[1:-1], np.inf)
+        line = self.level * C / max(self.m, 1)
+        possible = np.flatnonzero((self.counts>0) & (lo <= line))
+        if len(possible)==0: return None
+        certain = np.flatnonzero((self.counts>0) & (np.minimum(hi, 1.0) <= line))
+        return (int(certain[-1]) if len(certain) else 0), int(possible[-1])
+
+    def refine(self, pvals):
+        """Pass 2: keep the p-values that fall in the bins bracketing the threshold."""
+        if self._lo is None:
+            b = self._candidate_bins()
+            self._lo, self._hi = (1, 0) if b is None else b
+        p = np.asarray(pvals, dtype=float).ravel()
+        p = p[np.isfinite(p)]
+        b = self._bin(p)
+        self._cand.append(p[(b>=self._lo) & (b<=self._hi)])
+        return self
+
+    @property
+    def threshold(self):
+        """Exact BH/BY rejection threshold (reject p ≤ threshold); -inf if nothing is rejected."""
+        if self._threshold is None:
+            if self._lo is None: raise RuntimeError("call refine() on every chunk before threshold")
+            if self._lo > self._hi:
+                self._threshold = -np.inf
+            else:
+                v = np.sort(np.concatenate(self._cand))
+                below = int(self.counts[:self._lo].sum())
+                N = below + np.searchsorted(v, v, side="right")   # #{p ≤ v}
+                ok = v <= self.level * N / self.m
+                self._threshold = float(v[ok].max()) if ok.any() else -np.inf
+        return self._threshold
+
+    @property
+    def n_rejected(self):
+        t = self.threshold
+        if not np.isfinite(t): return 0
+        v = np.concatenate(self._cand)
+        return int(self.counts[:self._lo].sum() + np.sum(v <= t))
+
+    def reject(self, pvals):
+        return np.asarray(pvals, dtype=float) <= self.threshold
+
+    def qvalues(self, pvals):
+        """Upper bounds on the adjusted p-values at histogram resolution."""
+        C = np.cumsum(self.counts)
+        hi = np.append(self.edges[1:-1], 1.0)
+        c = _harmonic(self.m) if self.method=="by" else 1.0
+        with np.errstate(divide="ignore"):
+            qb = np.where(C>0, c*self.m*hi/np.maximum(C, 1), np.inf)
+        qb = np.minimum(np.minimum.accumulate(qb[::-1])[::-1], 1.0)
+        p = np.asarray(pvals, dtype=float)
+        return np.where(np.isfinite(p), qb[self._bin(np.where(np.isfinite(p), p, 1.0))], np.nan)
+
+@traced
+def hierarchical_fdr(pvals, families, alpha=0.05, method="bh"):
+    """Two-level FDR (Benjamini–Bogomolov): select families by BH on their Simes
+    p-values, then test within each selected family at α·R/F.
+
+    Returns {"families", "family_p", "family_q", "family_reject", "q", "reject"};
+    "q" are within-family adjusted p-values scaled by F/R (compare to α).
+    Non-finite p-values are not tested (NaN q, never rejected); a family with
+    none finite gets NaN family p/q and is not selected.
+    """
+    p = np.asarray(pvals, dtype=float).ravel()
+    g = np.asarray(families).ravel()
+    ok = np.isfinite(p)
+    if not ok.all():
+        fam = np.unique(g)
+        r = hierarchical_fdr(p[ok], g[ok], alpha, method)
+        at = np.searchsorted(fam, r["families"])
+        fp, fq, q = np.full(len(fam), np.nan), np.full(len(fam), np.nan), np.full(len(p), np.nan)
+        fr, rej = np.zeros(len(fam), dtype=bool), np.zeros(len(p), dtype=bool)
+        fp[at], fq[at], fr[at] = r["family_p"], r["family_q"], r["family_reject"]
+        q[ok], rej[ok] = r["q"], r["reject"]
+        return {"families": fam, "family_p": fp, "family_q": fq, "family_reject": fr, "q": q, "reject": rej}
+    fam, inv = np.unique(g, return_inverse=True)
+    F = len(fam)
+    order = np.lexsort((p, inv))
+    ps, gs = p[order], inv[order]
+    size = np.bincount(inv, minlength=F)
+    start = np.concatenate([[0], np.cumsum(size)[:-1]])
+    rank = np.arange(len(p)) - start[gs] + 1
+    if method not in ("bh", "by"): raise ValueError("method must be 'bh' or 'by'")
+    c = np.ones(F) if method=="bh" else np.array([_harmonic(n) for n in size])
+    raw = np.minimum(c[gs]*size[gs]*ps/rank, 1.0)
+    family_p = np.minimum(np.minimum.reduceat(size[gs]*ps/rank, start), 1.0) if len(p) else np.empty(0)  # Simes
+    family_q = fdr_adjust(family_p, method)
+    sel = family_q <= alpha
+    R = int(sel.sum())
+    # within-family step-up: reverse cumulative min that restarts at each family,
+    # by doubling (after the step with shift d each entry covers 2d of its family)
+    within, d = raw.copy(), 1
+    while d < (size.max() if F else 0):
+        same = gs[:-d] == gs[d:]
+        within[:-d] = np.where(same, np.minimum(within[:-d], within[d:]), within[:-d])
+        d *= 2
+    q = np.empty(len(p)); q[order] = np.where(sel[gs], np.minimum(within*F/max(R, 1), 1.0), 1.0)
+    return {"families": fam, "family_p": family_p, "family_q": family_q, "family_reject": sel,
+            "q": q, "reject": q <= alpha}
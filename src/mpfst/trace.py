@@ -0,0 +1,155 @@
+"""Opt-in tracing of pipeline stages: spans, counters, Chrome trace export.
+
+Off by default; a disabled span costs one global lookup. Enable with
+`enable()` / the `tracing()` context manager, or without code changes through
+the environment:
+
+    MPFST_TRACE=1            collect and print a summary table to stderr at exit
+    MPFST_TRACE=run.json     also write Chrome trace-event JSON (chrome://tracing,
+                             Perfetto) to run.json at exit
+    MPFST_TRACE_MEMORY=1     record net bytes allocated per span (tracemalloc;
+                             slows numpy-heavy code noticeably)
+    MPFST_TRACE_MAX_EVENTS   cap on buffered trace events (default 1e6; oldest dropped)
+
+Spans record wall time, the shapes and bytes of array arguments and, with
+memory tracing, the bytes still allocated when the span ends. `summary()`
+aggregates per span name: calls, total and self time (total minus child spans),
+input elements and bytes, in constant memory; individual events are buffered
+only when a Chrome trace is requested. Only the process that enabled tracing collects;
+pool workers inherit MPFST_TRACE but their spans are not merged.
+"""
+from __future__ import annotations
+import atexit, functools, json, os, sys, threading, time, tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+ENV, ENV_MEMORY, ENV_MAX_EVENTS = "MPFST_TRACE", "MPFST_TRACE_MEMORY", "MPFST_TRACE_MAX_EVENTS"
+_on = False
+_memory = False
+_keep = False       # buffer individual events (only needed for a Chrome trace)
+_events: deque = deque(maxlen=int(float(os.environ.get(ENV_MAX_EVENTS, 1e6))))
+_counters: dict = {}
+_local = threading.local()
+_NULL = nullcontext()
+
+def enable(memory: bool=False, events: bool=False):
+    """Start collecting aggregates; `events` also buffers per-call events for `write_chrome`."""
+    global _on, _memory, _keep
+    _memory, _keep = bool(memory), bool(events)
+    if _memory and not tracemalloc.is_tracing(): tracemalloc.start()
+    _on = True
+
+def disable():
+    global _on, _memory, _keep
+    if _memory and tracemalloc.is_tracing(): tracemalloc.stop()
+    _on = _memory = _keep = False
+
+def enabled() -> bool:
+    return _on
+
+def reset():
+    _events.clear(); _counters.clear()
+
+def _array_args(args, kwargs) -> dict:
+    shapes, nbytes, n = [], 0, 0
+    for v in (*args, *kwargs.values()):
+        s = getattr(v, "shape", None)
+        if s is None or not hasattr(v, "nbytes"): continue
+        shapes.append(list(s)); nbytes += int(v.nbytes); n += int(v.size)
+    return {"shapes": shapes, "elements": n, "bytes_in": nbytes} if shapes else {}
+
+class _Span:
+    __slots__ = ("name", "args", "t0", "child", "mem0")
+
+    def __init__(self, name, args):
+        self.name, self.args = name, args
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None: stack = _local.stack = []
+        stack.append(self)
+        self.child = 0.0
+        self.mem0 = tracemalloc.get_traced_memory()[0] if _memory else 0
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        dur = time.perf_counter() - self.t0
+        stack = _local.stack; stack.pop()
+        if stack: stack[-1].child += dur
+        if _memory: self.args["alloc_bytes"] = tracemalloc.get_traced_memory()[0] - self.mem0
+        if _keep: _events.append({"name": self.name, "ph": "X", "ts": self.t0*1e6, "dur": dur*1e6,
+                                  "pid": os.getpid(), "tid": threading.get_ident(), "args": self.args})
+        c = _counters.get(self.name)
+        if c is None: c = _counters[self.name] = {"calls": 0, "total_s": 0.0, "self_s": 0.0, "max_s": 0.0,
+                                                  "elements": 0, "bytes_in": 0, "alloc_bytes": 0}
+        c["calls"] += 1; c["total_s"] += dur; c["self_s"] += dur - self.child; c["max_s"] = max(c["max_s"], dur)
+        c["elements"] += self.args.get("elements", 0); c["bytes_in"] += self.args.get("bytes_in", 0)
+        c["alloc_bytes"] += self.args.get("alloc_bytes", 0)
+        return False
+
+def span(name: str, **args):
+    """Context manager timing a block as span `name` (a shared no-op when tracing is off)."""
+    return _Span(name, args) if _on else _NULL
+
+def count(name: str, n=1):
+    """Add n to counter `name` (exported as a Chrome counter track)."""
+    if not _on: return
+    c = _counters.setdefault(name, {"count": 0})
+    c["count"] = c.get("count", 0) + n
+    if _keep: _events.append({"name": name, "ph": "C", "ts": time.perf_counter()*1e6, "pid": os.getpid(),
+                              "tid": threading.get_ident(), "args": {"count": c["count"]}})
+
+def traced(fn=None, *, name: str|None=None):
+    """Record each call of `fn` as a span (named `<subpackage>.<module>.<function>`) while tracing is on."""
+    if fn is None: return functools.partial(traced, name=name)
+    label = name or f"{fn.__module__.removeprefix('mpfst.')}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _on: return fn(*args, **kwargs)
+        with _Span(label, _array_args(args, kwargs)):
+            return fn(*args, **kwargs)
+    return wrapper
+
+def summary() -> list[dict]:
+    """Aggregated spans (by self time, descending) followed by plain counters."""
+    rows = [dict(name=k, **v) for k, v in _counters.items() if "calls" in v]
+    rows.sort(key=lambda r: r["self_s"], reverse=True)
+    return rows + [{"name": k, "count": v["count"]} for k, v in _counters.items() if "calls" not in v]
+
+def format_summary() -> str:
+    rows = summary()
+    head = f"{'span':<48} {'calls':>7} {'total s':>10} {'self s':>10} {'max s':>9} {'elements':>12} {'alloc MB':>9}"
+    lines = [head, "-"*len(head)]
+    for r in rows:
+        if "calls" in r:
+            lines.append(f"{r['name']:<48} {r['calls']:>7} {r['total_s']:>10.4f} {r['self_s']:>10.4f} "
+                         f"{r['max_s']:>9.4f} {r['elements']:>12} {r['alloc_bytes']/2**20:>9.1f}")
+        else:
+            lines.append(f"{r['name']:<48} {r['count']:>7}")
+    return "\n".join(lines)
+
+def write_chrome(path):
+    """Write the collected events as Chrome trace-event JSON."""
+    with open(path, "w") as f:
+        json.dump({"traceEvents": list(_events), "displayTimeUnit": "ms"}, f)
+
+@contextmanager
+def tracing(path=None, memory: bool=False):
+    """Trace the enclosed block; with `path`, write its Chrome trace on exit."""
+    was = _on
+    enable(memory, events=bool(path) or _keep)
+    try:
+        yield
+    finally:
+        if not was: disable()
+        if path: write_chrome(path)
+
+def _at_exit(target):
+    if target.endswith(".json"): write_chrome(target)
+    print(format_summary(), file=sys.stderr)
+
+if os.environ.get(ENV) and os.environ[ENV] != "0":
+    enable(memory=os.environ.get(ENV_MEMORY, "0") not in ("", "0"), events=os.environ[ENV].endswith(".json"))
+    atexit.register(_at_exit, os.environ[ENV])
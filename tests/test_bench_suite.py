@@ -0,0 +1,26 @@
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location("bench_suite", Path(__file__).parents[1]/"benchmarks"/"bench_suite.py")
+bench = importlib.util.module_from_spec(_spec); _spec.loader.exec_module(bench)
+
+def test_small_tier_runs_and_self_compare_is_clean():
+    res = bench.run([1000, 2000], cases=["hurst_dfa", "superradiance_gate"], repeat=1)
+    assert [(r["case"], r["n"]) for r in res["results"]] == [("hurst_dfa", 1000), ("hurst_dfa", 2000),
+                                                              ("superradiance_gate", 1000), ("superradiance_gate", 2000)]
+    assert all(r["seconds"] > 0 and r["peak_mb"] > 0 for r in res["results"])
+    assert bench.compare(res, res) == []
+
+def test_compare_flags_slowdowns_and_memory():
+    base = {"results": [{"case": "a", "n": 10, "seconds": 1.0, "peak_mb": 10.0},
+                        {"case": "b", "n": 10, "seconds": 0.001, "peak_mb": 1.0}]}
+    cur = {"results": [{"case": "a", "n": 10, "seconds": 1.5, "peak_mb": 20.0},
+                       {"case": "b", "n": 10, "seconds": 0.002, "peak_mb": 1.0},   # below min_delta_s
+                       {"case": "c", "n": 10, "seconds": 9.0}]}                     # not in baseline
+    reg = bench.compare(cur, base, tolerance=0.25)
+    assert [(r["case"], r["metric"]) for r in reg] == [("a", "seconds"), ("a", "peak_mb")]
+
+def test_ci_mean_speedup_is_recorded():
+    res = bench.run([1000], cases=["ci_mean", "ci_mean_loop"], repeat=1, memory=False)
+    fast = next(r for r in res["results"] if r["case"] == "ci_mean")
+    assert fast["speedup_vs_loop"] > 0
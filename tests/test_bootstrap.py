@@ -0,0 +1,19 @@
+import numpy as np
+from mpfst.stats.bootstrap import bootstrap, ci_mean
+
+def test_bootstrap_mean_agrees_with_ci_mean():
+    x = np.random.default_rng(0).exponential(size=2000)
+    lo, hi = ci_mean(x, seed=1)
+    r = bootstrap(x, seed=1, max_bytes=2**20)
+    assert r["distribution"].shape == (2000,)
+    assert np.isclose(r["estimate"], x.mean())
+    assert abs(r["ci"][0]-lo) < 0.02 and abs(r["ci"][1]-hi) < 0.02
+    assert bootstrap(x, seed=1)["ci"] == (lo, hi)   # ci_mean runs on the engine
+
+def test_bootstrap_deterministic_and_bca():
+    x = np.random.default_rng(2).lognormal(size=300)
+    a = bootstrap(x, np.median, n_boot=500, seed=3, max_bytes=2**16)
+    b = bootstrap(x, np.median, n_boot=500, seed=3, max_bytes=2**16, workers=2)
+    assert np.array_equal(a["distribution"], b["distribution"])
+    c = bootstrap(x, np.median, n_boot=500, seed=3, max_bytes=2**16, method="bca")
+    assert c["ci"][0] < c["estimate"] < c["ci"][1]
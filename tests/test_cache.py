@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pytest
+from mpfst import cache
+from mpfst.spectral.utils import octave_band_edges, filterbank_energy
+from mpfst.coherence.metrics import spectral_slope_gamma
+from mpfst.nulls.phase_randomize import phase_randomize
+
+@pytest.fixture
+def cdir(tmp_path, monkeypatch):
+    monkeypatch.delenv(cache.ENV_DIR, raising=False); monkeypatch.delenv(cache.ENV_MAX, raising=False)
+    cache.clear()   # per-process counters
+    cache.enable(tmp_path/"cache")
+    yield tmp_path/"cache"
+    cache.disable()
+
+def _gamma(seed):
+    x = np.random.default_rng(0).standard_normal(4096)
+    return spectral_slope_gamma(x, fs=128.0)
+
+def test_hits_misses_and_bypass(cdir):
+    x = np.random.default_rng(0).standard_normal(8192)
+    edges = octave_band_edges(2, 64, 5)
+    E = filterbank_energy(x, 256.0, edges, backend="fft")
+    E2 = filterbank_energy(x, 256.0, edges, backend="fft")
+    assert type(E2) is np.ndarray and np.array_equal(E, E2)
+    E2[0] += 1.0                                    # hits are writable, like misses
+    y = phase_randomize(x, seed=3); z = phase_randomize(x, seed=3)
+    z *= 2.0; assert np.allclose(z, 2*y)
+    filterbank_energy(x + 1e-9, 256.0, edges, backend="fft")
+    g = spectral_slope_gamma(x, fs=256.0)
+    assert spectral_slope_gamma(x, fs=256.0) == g
+    phase_randomize(x); phase_randomize(x)          # seed=None: never cached
+    assert np.array_equal(phase_randomize(x, seed=3), phase_randomize(x, seed=3))
+    s = cache.stats()
+    assert (s["hits"], s["misses"], s["bypassed"], s["entries"]) == (5, 4, 2, 4)
+
+def test_lru_eviction_bound(cdir):
+    cache.enable(cdir, max_bytes=300_000)
+    edges = octave_band_edges(2, 64, 5)
+    for i in range(2):   # ~330 kB per entry
+        filterbank_energy(np.random.default_rng(i).standard_normal(8192), 256.0, edges, backend="fft")
+    s = cache.stats()
+    assert s["bytes"] <= 300_000 and s["evictions"] >= 1
+
+def test_concurrent_workers_share_entry(cdir):
+    with ProcessPoolExecutor(4) as ex:
+        vals = list(ex.map(_gamma, range(8)))
+    assert len(set(vals)) == 1 and cache.stats()["entries"] == 1
+    assert _gamma(0) == vals[0] and cache.stats()["hits"] == 1
@@ -0,0 +1,19 @@
+import json, subprocess, sys
+from mpfst.cli import main, COMMANDS
+
+def test_vbk_subcommand_matches_gate(capsys):
+    assert main(["vbk", "--M", "1", "--a", "0.9", "--mu", "0.05"]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["gate"] is True and out["weight"] > 0
+    assert main(["nope"]) == 2
+
+def test_vbk_path_stays_light():
+    code = ("import sys; from mpfst.cli import main; main(['vbk','--M','1','--a','0.9','--mu','0.05']);"
+            "print(sorted(m for m in ('numpy','scipy','pandas','statsmodels','sklearn') if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip().splitlines()[-1] == "[]"
+
+def test_every_command_resolves():
+    from importlib import import_module
+    for module, func, _ in COMMANDS.values():
+        assert callable(getattr(import_module(module), func))
@@ -0,0 +1,37 @@
+import numpy as np
+from mpfst.dimension.collapse import (participation_ratio, low_rank_collapse,
+                                      randomized_svd, sliding_participation_ratio)
+
+def _data(T, p, rank=3, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((T, rank)) @ rng.standard_normal((rank, p)) + 0.1*rng.standard_normal((T, p))
+
+def test_collapse_matches_full_svd_both_shapes():
+    for shape in ((400, 20), (20, 400)):
+        X = _data(*shape)
+        s = np.linalg.svd(X - X.mean(axis=0), compute_uv=False)
+        r = low_rank_collapse(X)
+        assert np.isclose(r["pr"], participation_ratio(s))
+        assert np.allclose(r["singular_values"], s, atol=1e-5)
+        assert np.allclose(low_rank_collapse(X, k=3, seed=0)["singular_values"], s[:3], rtol=1e-6)
+
+def test_randomized_svd_leading_spectrum():
+    X = _data(300, 50, rank=5, seed=1)
+    U, s, Vt = randomized_svd(X, 5, seed=0)
+    assert np.allclose(s, np.linalg.svd(X, compute_uv=False)[:5], rtol=1e-6)
+    assert np.allclose(U.T @ U, np.eye(5), atol=1e-8)
+
+def test_sliding_pr_matches_per_window():
+    X = _data(2000, 16, seed=2)
+    for hop, refresh in ((7, 1024), (7, 5), (400, 1024)):
+        r = sliding_participation_ratio(X, win=256, hop=hop, refresh=refresh)
+        ref = [low_rank_collapse(X[s:s+256])["pr"] for s in r["start"]]
+        assert np.allclose(r["pr"], ref)
+    wide = sliding_participation_ratio(X[:, :16], win=8, hop=3)
+    assert np.allclose(wide["pr"], [low_rank_collapse(X[s:s+8, :16])["pr"] for s in wide["start"]])
+
+def test_sliding_pr_with_dc_offset():
+    X = _data(2000, 16, seed=3) + 1e6
+    r = sliding_participation_ratio(X, win=256, hop=7)
+    ref = [low_rank_collapse(X[s:s+256])["pr"] for s in r["start"]]
+    assert np.allclose(r["pr"], ref, rtol=1e-6)
@@ -0,0 +1,29 @@
+import numpy as np
+from mpfst.coherence.dfa import dfa, dfa_scales
+from mpfst.coherence.metrics import hurst_dfa
+
+def _dfa1_loop(x, scales):
+    y = np.cumsum(x - x.mean())
+    F = []
+    for s in scales:
+        z = y[:len(y)//s*s].reshape(-1, s); t = np.arange(s)
+        A = np.vstack([np.ones_like(t), t]).T
+        coef, *_ = np.linalg.lstsq(A, z.T, rcond=None)
+        F.append(np.sqrt(np.mean((z - (A @ coef).T)**2)))
+    return np.array(F)
+
+def test_dfa_order1_matches_loop():
+    x = np.random.default_rng(0).standard_normal(3000)
+    out = dfa(x)
+    assert np.array_equal(out["scales"], dfa_scales())
+    assert np.allclose(out["F"], _dfa1_loop(x, out["scales"]), rtol=1e-10)
+    assert np.isclose(out["H"], hurst_dfa(x))
+    assert abs(out["H"] - 0.5) < 0.1
+
+def test_dfa_batched_orders():
+    X = np.random.default_rng(1).standard_normal((3, 2048))
+    for order in (1, 2, 3):
+        out = dfa(X, order=order, overlap=0.5, both_directions=True)
+        assert out["F"].shape == (3, len(out["scales"])) and out["H"].shape == (3,)
+        assert np.all(np.abs(out["H"] - 0.5) < 0.15)
+    assert np.allclose(dfa(X)["H"], [hurst_dfa(r) for r in X])
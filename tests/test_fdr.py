@@ -0,0 +1,72 @@
+import numpy as np
+from mpfst.stats.fdr import bh_fdr, bh_adjust, by_adjust, StreamingFDR, hierarchical_fdr
+
+def _pvals(n, seed=0):
+    rng = np.random.default_rng(seed)
+    p = rng.random(n)
+    p[:n//10] = rng.beta(0.05, 20, n//10)   # signal
+    return rng.permutation(p)
+
+def test_adjusted_qvalues_match_reference_and_order():
+    p = _pvals(2000)
+    q = bh_adjust(p)
+    order = np.argsort(p); m = len(p)
+    ref = np.minimum(1, np.minimum.accumulate((p[order]*m/np.arange(1, m+1))[::-1])[::-1])
+    assert np.allclose(q[order], ref)
+    assert int(np.sum(q <= 0.05)) == bh_fdr(p, 0.05)
+    assert np.all(by_adjust(p) >= q)
+
+def test_streaming_threshold_is_exact():
+    p = _pvals(50_000, seed=1)
+    chunks = np.array_split(p, 7)
+    for method, adjust in (("bh", bh_adjust), ("by", by_adjust)):
+        s = StreamingFDR(0.05, method)
+        for c in chunks: s.update(c)
+        for c in chunks: s.refine(c)
+        mask = np.concatenate([s.reject(c) for c in chunks])
+        q = adjust(p)
+        assert np.array_equal(mask, q <= 0.05) and s.n_rejected == mask.sum()
+        qs = np.concatenate([s.qvalues(c) for c in chunks])
+        assert np.all(qs >= q - 1e-12)
+
+def test_hierarchical_fdr_selects_signal_family():
+    rng = np.random.default_rng(2)
+    p = np.concatenate([rng.beta(0.05, 20, 50), rng.random(950)])
+    fam = np.repeat(np.arange(20), 50)
+    r = hierarchical_fdr(p, fam, alpha=0.05)
+    assert r["family_reject"][0] and r["family_reject"].sum() <= 2
+    assert r["reject"][:50].sum() > 0 and r["reject"][50:].sum() <= 5
+    one = hierarchical_fdr(p[:50], np.zeros(50))
+    assert np.allclose(one["q"], bh_adjust(p[:50]))
+
+def test_nan_pvalues_are_skipped():
+    p = _pvals(500, seed=3)
+    pn = p.copy(); pn[::7] = np.nan
+    ok = np.isfinite(pn)
+    q = bh_adjust(pn)
+    assert np.all(np.isnan(q[~ok])) and np.allclose(q[ok], bh_adjust(pn[ok]))
+    assert np.isnan(by_adjust([np.nan, np.nan])).all()
+    s = StreamingFDR(0.05)
+    s.update(pn); s.refine(pn)
+    assert s.m == ok.sum() and s.n_rejected == int(np.sum(q[ok] <= 0.05))
+    assert np.array_equal(s.reject(pn), np.nan_to_num(q, nan=1.0) <= 0.05) and np.isnan(s.qvalues(pn)[~ok]).all()
+    fam = np.repeat(np.arange(10), 50); pn[fam==9] = np.nan
+    h, ref = hierarchical_fdr(pn, fam), hierarchical_fdr(pn[np.isfinite(pn)], fam[np.isfinite(pn)])
+    assert np.isnan(h["family_p"][9]) and not h["family_reject"][9] and not h["reject"][fam==9].any()
+    assert np.allclose(h["q"][np.isfinite(pn)], ref["q"])
+
+def test_granger_matrix_nan_diagonal():
+    from mpfst.causality.granger import granger_matrix
+    X = np.random.default_rng(0).standard_normal((3, 400))
+    q = bh_adjust(granger_matrix(X, maxlag=2)["p_min"])
+    assert np.isnan(np.diag(q)).all() and np.isfinite(q[~np.eye(3, dtype=bool)]).all()
+
+def test_hierarchical_fdr_many_families_keeps_small_q():
+    rng = np.random.default_rng(5)
+    fam = np.repeat(np.arange(5000), 4)
+    p = rng.random(fam.size); p[::4] = 1e-15*rng.random(5000) + 1e-16
+    r = hierarchical_fdr(p, fam)
+    F, R = 5000, int(r["family_reject"].sum())
+    for f in (0, 2500, 4999):
+        i = fam == f
+        assert np.allclose(r["q"][i], np.minimum(bh_adjust(p[i])*F/R, 1.0), rtol=1e-12, atol=0)
@@ -0,0 +1,38 @@
+import subprocess, sys
+import numpy as np
+from mpfst.fractional.inversion import invert_beta
+from mpfst.fractional.response import envelope_rows, fit_tail_exponent, prediction_table
+
+def test_invert_beta_arrays_match_scalar():
+    mu = np.array([1.2, 2.5, np.nan, 1.8, np.nan])
+    gamma = np.array([1.0, np.nan, 0.7, 1.4, np.nan])
+    beta = invert_beta(mu, gamma, None)
+    expect = [invert_beta(None if np.isnan(m) else m, None if np.isnan(g) else g, None) for m, g in zip(mu, gamma)]
+    assert np.allclose(beta, expect, equal_nan=True)
+    assert invert_beta(1.5, np.ones(3), None).shape == (3,)
+    assert isinstance(invert_beta(1.5, 1.0, 0.7), float)
+
+def test_tail_exponent_recovered():
+    fs = 1000.0; t = np.arange(4096)/fs
+    X = np.stack([(t+0.01)**-p * np.cos(2*np.pi*50*t) for p in (0.5, 1.0)])
+    fit = fit_tail_exponent(envelope_rows(np.concatenate([np.zeros((2, 200)), X], axis=1)), fs)
+    assert np.allclose(fit["p"], [0.5, 1.0], atol=0.03) and np.all(fit["r2"] > 0.99)
+    fit = fit_tail_exponent(np.stack([(t+0.01)**-p for p in (1.5, 2.0)]), fs)
+    assert np.allclose(fit["p"], [1.5, 2.0], atol=0.1)
+    assert np.isnan(fit_tail_exponent(np.zeros(64))["p"])
+
+def test_prediction_table_columns():
+    x = np.random.default_rng(0).standard_normal(12000)
+    tab = prediction_table(x, 500.0, 2048, 1024)
+    n = len(tab["t"])
+    assert n == (12000 - 2048)//1024 + 1
+    assert all(len(v) == n for v in tab.values())
+    assert np.allclose(tab["residual"], tab["p_obs"] - tab["p_pred"], equal_nan=True)
+
+def test_invert_cli_table(tmp_path):
+    (tmp_path/"tri.csv").write_text("mu,gamma,H\n1.5,1.0,0.7\n2.5,,0.5\n")
+    out = subprocess.run([sys.executable, "-m", "mpfst", "invert", "--input", str(tmp_path/"tri.csv")],
+                         capture_output=True, text=True, check=True).stdout.splitlines()
+    assert out[0] == "mu,gamma,H,beta"
+    assert np.isclose(float(out[1].split(",")[-1]), invert_beta(1.5, 1.0, 0.7))
+    assert float(out[2].split(",")[-1]) == 0.0
@@ -0,0 +1,34 @@
+import numpy as np
+from mpfst.causality.granger import granger_pair, granger_matrix, granger_matrix_windows
+
+def _var(N=4, T=300, seed=0):
+    X = np.random.default_rng(seed).standard_normal((N, T))
+    for t in range(2, T):
+        X[1, t] += 0.5*X[0, t-1] + 0.3*X[2, t-2]
+    return X
+
+def test_granger_matrix_matches_pairwise():
+    X = _var()
+    r = granger_matrix(X, maxlag=3)
+    assert r["F"].shape == (3, 4, 4) and np.all(np.isnan(np.diagonal(r["p"], axis1=1, axis2=2)))
+    for j in range(4):
+        for i in range(4):
+            if i != j:
+                assert np.isclose(r["p_min"][j, i], granger_pair(X[j], X[i], maxlag=3), rtol=1e-6, atol=1e-12)
+    assert r["p_min"][0, 1] < 1e-6 and r["p_min"][2, 1] < 1e-3
+
+def test_granger_windows_stack():
+    X = _var(N=3, T=400)
+    w = granger_matrix_windows(X, win=200, hop=100, maxlag=2)
+    assert w["p"].shape == (3, 2, 3, 3)
+    assert np.allclose(w["F"][1], granger_matrix(X[:, 100:300], 2)["F"], equal_nan=True)
+
+def test_granger_matrix_rank_deficient_pairs_are_nan():
+    X = _var(N=4, T=300)
+    X[2] = 3.0                 # constant channel
+    X[3] = 2.0*X[0] + 1.0      # collinear with channel 0
+    r = granger_matrix(X, maxlag=2)
+    P = r["p_min"]
+    assert np.isnan(P[2]).all() and np.isnan(P[:, 2]).all()
+    assert np.isnan(P[3, 0]) and np.isnan(P[0, 3])
+    assert np.isfinite(P[0, 1]) and np.isfinite(P[1, 0])
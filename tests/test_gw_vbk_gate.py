@@ -8,3 +8,60 @@ def test_vbk_overlap_highspin():
     assert superradiance_overlap(p) is True
     g,w = evaluate('gw_vbk', M=1.0, a=0.9, Q=0.0, m=1, q=0.0, mu=0.05, C=1.0)
     assert g is True and w > 0.0
+
+def test_gate_grid_matches_scalar_and_masks_extremal(tmp_path):
+    import numpy as np
+    from mpfst.domains.gw_superradiance import (gate_grid, evaluate_gate_and_weight,
+                                                write_gate_grid, GRID_AXES)
+    rng = np.random.default_rng(0)
+    M = rng.uniform(0.5, 2, 300); a = rng.uniform(0, 1.5, 300)*M; Q = rng.uniform(0, 0.5, 300)*M
+    m = rng.integers(1, 4, 300); q = rng.uniform(0, 1, 300); mu = rng.uniform(0, 0.6, 300)
+    g = gate_grid(M, a, Q, m, q, mu, C=2.0)
+    for i in range(300):
+        p = BHParams(M=M[i], a=a[i], Q=Q[i], m=int(m[i]), q=q[i], mu=mu[i])
+        if M[i]**2 < a[i]**2 + Q[i]**2:
+            assert not g["gate"][i] and g["weight"][i] == 0.0 and np.isnan(g["omega_c"][i])
+            continue
+        assert (bool(g["gate"][i]), g["weight"][i]) == evaluate_gate_and_weight(p, C=2.0)
+        assert g["omega_c"][i] == omega_c(p) and g["mu0"][i] == mu0(p)
+    axes = dict(M=[1.0], a=np.linspace(0, 1.2, 7), Q=[0.0], m=[1, 2], q=[0.0], mu=np.linspace(0, 0.5, 5))
+    out = write_gate_grid(axes, str(tmp_path/"grid.npz"), chunk=11)[0]
+    z = np.load(out)
+    ref = gate_grid(*np.meshgrid(*(np.asarray(axes[k], float) for k in GRID_AXES), indexing="ij"))
+    for k in ("gate", "weight", "mu0"): assert np.array_equal(z[k], ref[k])
+    assert np.array_equal(z["omega_c"], ref["omega_c"], equal_nan=True)
+
+def test_catalog_batch_matches_per_event(tmp_path):
+    import numpy as np
+    from pathlib import Path
+    from mpfst.domains.gw_catalog import load_catalog, evaluate_catalog, write_table
+    from mpfst.gating.linear_response import evaluate_many, register, _REGISTRY, _MANY
+    cat = load_catalog(Path(__file__).parent/"data"/"gwosc_fixture.json")
+    assert list(cat["event"]) == ["GW150914", "GW151226", "GW170104", "GW170817"]
+    assert cat["M"][2] == 48.9 and np.isnan(cat["chi"][3])
+    mu = np.linspace(0.0005, 0.01, 9)
+    t = evaluate_catalog(cat, mu, workers=2, block=2)
+    assert len(t["gate"]) == 36 and not t["gate"][27:].any()
+    for i in range(27):
+        assert (bool(t["gate"][i]), t["weight"][i]) == evaluate('gw_vbk', M=t["M"][i], a=t["a"][i], mu=t["mu"][i])
+    # per-row fallback for adapters without a vectorized evaluator
+    register('gw_vbk_rows', _REGISTRY['gw_vbk'])
+    try:
+        g, w = evaluate_many('gw_vbk_rows', M=cat["M"][:3, None], a=(cat["chi"]*cat["M"])[:3, None], mu=mu[None, :])
+        assert np.array_equal(g.ravel(), t["gate"][:27]) and np.array_equal(w.ravel(), t["weight"][:27])
+    finally:
+        _REGISTRY.pop('gw_vbk_rows', None); _MANY.pop('gw_vbk_rows', None)
+    write_table(t, str(tmp_path/"out.csv"))
+    assert (tmp_path/"out.csv").read_text().splitlines()[0] == "event,M,chi,a,mu,gate,weight"
+
+def test_catalog_directory_dedupes_events(tmp_path):
+    import json, shutil
+    from pathlib import Path
+    from mpfst.domains.gw_catalog import load_catalog
+    src = Path(__file__).parent/"data"/"gwosc_fixture.json"
+    shutil.copy(src, tmp_path/"GWTC.json")
+    events = json.loads(src.read_text())["events"]
+    key = next(iter(events))
+    (tmp_path/f"GWTC_{key}.json").write_text(json.dumps({"events": {key: events[key]}}))
+    cat = load_catalog(tmp_path)
+    assert list(cat["event"]) == list(load_catalog(src)["event"])
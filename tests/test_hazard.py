@@ -0,0 +1,20 @@
+import numpy as np
+from mpfst.gating.hazard import HazardAccumulator, hazard_curve
+
+def _loop_hazard(m_l, events, bins):
+    edges = np.linspace(0, 1, bins+1)
+    idx = np.digitize(m_l, edges)-1
+    return np.array([events[idx==b].mean() if (idx==b).sum()>=5 else np.nan for b in range(bins)])
+
+def test_accumulator_matches_hazard_curve_and_merges():
+    rng = np.random.default_rng(0)
+    m = np.concatenate([rng.beta(2, 5, 3000), [0.0, 1.0, -0.1, np.nan]])
+    e = rng.random(len(m)) < np.nan_to_num(m)
+    c, h = hazard_curve(m, e, bins=16)
+    assert np.array_equal(h, _loop_hazard(m, e, 16), equal_nan=True)
+    shards = [HazardAccumulator(16).update(m[i:i+700], e[i:i+700]) for i in range(0, len(m), 700)]
+    total = sum(shards[1:], shards[0])
+    assert np.array_equal(total.result()[1], h, equal_nan=True) and np.allclose(total.result()[0], c)
+    lo, hi = total.bands(seed=0, n_boot=200)
+    ok = np.isfinite(h) & np.isfinite(lo)
+    assert np.all(lo[ok] <= h[ok] + 1e-12) and np.all(h[ok] <= hi[ok] + 1e-12)
@@ -0,0 +1,51 @@
+import numpy as np
+from mpfst.coherence.hill import hill_plot, hill_estimate, rolling_hill, select_k
+from mpfst.coherence.metrics import heavy_tail_mu_hill
+from mpfst.coherence.rolling import window_view
+
+def _pareto_walk(n, alpha, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.cumsum(rng.choice([-1.0, 1.0], n) * (rng.pareto(alpha, n) + 1))
+
+def test_hill_plot_matches_full_sort():
+    x = _pareto_walk(5000, 1.5)
+    a = np.sort(np.abs(np.diff(x)))[::-1]
+    plot = hill_plot(x, k_max=200)
+    k = plot["k"][[0, 49, 199]]
+    expect = [1.0/(np.mean(np.log(a[:kk])) - np.log(a[kk]) + 1e-12) for kk in k]
+    assert np.allclose(plot["alpha"][[0, 49, 199]], expect)
+    assert np.isclose(hill_estimate(x, k=249)["alpha"], heavy_tail_mu_hill(x))   # default q=0.95 uses k=249
+
+def test_auto_k_recovers_tail_index():
+    X = np.stack([_pareto_walk(50_000, a, seed=i) for i, a in enumerate((1.0, 1.5, 2.5))])
+    for method in ("stability", "amse"):
+        est = hill_estimate(X, method=method)
+        assert np.allclose(est["alpha"], [1.0, 1.5, 2.5], rtol=0.15) and np.all(est["k"] >= 5)
+    assert np.allclose(heavy_tail_mu_hill(X, k="auto"), hill_estimate(X)["alpha"])
+    assert select_k(np.full((2, 30), np.nan))[0] == -1
+
+def test_rolling_hill_reuses_order_statistics_exactly():
+    x = np.round(_pareto_walk(20_000, 2.0), 1)   # ties and zero increments
+    for win, hop in [(1000, 7), (800, 400), (300, 500)]:
+        r = rolling_hill(x, win, hop, fs=10.0, k_max=60)
+        ref = hill_plot(window_view(x, win, hop), k_max=60)["alpha"]
+        assert np.allclose(r["plot"], ref, equal_nan=True)
+        assert len(r["t"]) == len(r["alpha"]) == ref.shape[0] and np.isclose(r["t"][0], win/2/10.0)
+
+def test_explicit_k_drops_zero_increments():
+    x = np.repeat(_pareto_walk(2000, 1.5), 3)    # two of every three increments are zero
+    assert np.isclose(heavy_tail_mu_hill(x, k=99), heavy_tail_mu_hill(x))   # 1999 positive → q path uses k=99
+    assert np.isclose(heavy_tail_mu_hill(x, k=99), hill_estimate(np.abs(np.diff(x))[np.diff(x) != 0], k=99, increments=False)["alpha"])
+    short = np.repeat(np.arange(9.0), 50)        # 8 nonzero increments
+    assert np.isnan(heavy_tail_mu_hill(short, k=5)) and np.isnan(heavy_tail_mu_hill(short, k="auto"))
+    rows = heavy_tail_mu_hill(np.stack([x[:3000], np.pad(short, (0, 2550), mode="edge")]), k=5)
+    assert np.isfinite(rows[0]) and np.isnan(rows[1])
+
+def test_explicit_k_rows_match_single_series():
+    rng = np.random.default_rng(4)
+    X = np.round(np.cumsum(rng.standard_t(3, (3, 5000)), axis=1)*0.3)   # many zero increments
+    X[2, 40:] = X[2, 40]                                               # ~30 nonzero steps
+    for k in (50, "auto"):
+        rows = heavy_tail_mu_hill(X, k=k)
+        assert np.allclose(rows, [heavy_tail_mu_hill(r, k=k) for r in X], equal_nan=True)
+    assert np.isfinite(heavy_tail_mu_hill(X, k=20)[2])
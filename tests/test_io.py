@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from mpfst.io import Signal, read_signal, write_signal, iter_chunks
+
+def test_roundtrip_and_memmap(tmp_path):
+    x = np.random.default_rng(0).standard_normal((3, 1000))
+    sig = Signal(x, fs=250.0, t0=12.5, channels=["a", "b", "c"])
+    for name in ("s.npy", "s.npz", "s.csv"):
+        write_signal(sig, tmp_path/name)
+        r = read_signal(tmp_path/name)
+        assert np.allclose(r.samples, x) and np.isclose(r.fs, 250.0) and np.isclose(r.t0, 12.5)
+        assert r.channels == ["a", "b", "c"] and np.array_equal(r.channel("b"), r.samples[1])
+        if name != "s.csv": assert isinstance(r.samples, np.memmap)
+    with pytest.raises(ValueError):
+        np.save(tmp_path/"bare.npy", x[0]); read_signal(tmp_path/"bare.npy")
+    assert read_signal(tmp_path/"bare.npy", fs=100).fs == 100
+
+def test_chunks_cover_with_overlap():
+    x = np.arange(103)
+    got = list(iter_chunks(x, 20, overlap=5))
+    assert [s for s, _ in got] == list(range(0, 98, 15))
+    assert all(np.array_equal(c, x[s:s+20]) for s, c in got) and got[-1][1][-1] == 102
+    assert all(len(c) == 20 for _, c in iter_chunks(x, 20, 5, drop_last=True))
+
+def test_cli_reads_npz(tmp_path, capsys):
+    from mpfst.cli import main
+    x = np.random.default_rng(1).standard_normal(4096)
+    write_signal(Signal(x, fs=256.0), tmp_path/"x.npz")
+    main(["meter", "--input", str(tmp_path/"x.npz")])
+    via_npz = capsys.readouterr().out
+    write_signal(Signal(x, fs=256.0), tmp_path/"x.csv")
+    main(["meter", "--csv", str(tmp_path/"x.csv"), "--fs", "256"])
+    assert capsys.readouterr().out == via_npz and via_npz.startswith("mu=")
@@ -0,0 +1,19 @@
+import numpy as np
+from mpfst.coherence.metrics import spectral_slope_gamma, hurst_dfa, heavy_tail_mu_hill
+from mpfst.coherence.meter import compute_m_l
+
+def test_metrics_accept_channels_by_time():
+    rng = np.random.default_rng(0)
+    X = np.cumsum(rng.standard_t(3, size=(6, 4096)), axis=-1) * np.arange(1, 7)[:, None]
+    X[3] = rng.standard_normal(4096)
+    mu, gamma, H = heavy_tail_mu_hill(X), spectral_slope_gamma(X, fs=128.0), hurst_dfa(X)
+    assert mu.shape == gamma.shape == H.shape == (6,)
+    for i, x in enumerate(X):
+        assert np.isclose(mu[i], heavy_tail_mu_hill(x))
+        assert np.isclose(gamma[i], spectral_slope_gamma(x, fs=128.0))
+        assert np.isclose(H[i], hurst_dfa(x))
+    m = compute_m_l(mu, gamma, H)
+    assert m.shape == (6,)
+    assert np.allclose(m, [compute_m_l(a, b, c) for a, b, c in zip(mu, gamma, H)])
+    assert np.allclose(compute_m_l(mu, None, H), [compute_m_l(a, None, c) for a, c in zip(mu, H)])
+    assert isinstance(compute_m_l(1.5, 1.0, 0.7), float)
@@ -0,0 +1,33 @@
+import numpy as np
+from scipy.stats import gaussian_kde
+from mpfst.stats.modality import binned_kde, dip_proxy_kde, dip_statistic, dip_test
+
+def test_binned_kde_matches_gaussian_kde():
+    x = np.random.default_rng(0).normal(size=3000)
+    for bw in ("scott", "silverman", 0.3):
+        t, y = binned_kde(x, bw)
+        assert np.max(np.abs(y - gaussian_kde(x, bw)(t))) < 1e-3 * y.max()
+    x2 = np.r_[x, x + 6]
+    assert dip_proxy_kde(x2, method="binned") == dip_proxy_kde(x2, method="direct") == {"n_peaks": 2}
+
+def test_dip_statistic_reference_values():
+    # uniform grid is perfectly unimodal
+    assert dip_statistic(np.arange(100.0)) == 0.0
+    # two equal point clusters: dip = 1/4 in the limit
+    x = np.r_[np.linspace(0, 0.01, 500), np.linspace(1, 1.01, 500)]
+    assert abs(dip_statistic(x) - 0.25) < 0.01
+
+def test_dip_statistic_tied_data():
+    # values from the reference implementation (R/Python `diptest`, which sorts and keeps ties)
+    assert np.isclose(dip_statistic(np.r_[np.zeros(50), np.ones(50)]), 0.25)
+    assert np.isclose(dip_statistic([0, 0, 0, 1, 1, 2, 2, 2, 2, 5]), 0.15)
+    assert np.isclose(dip_statistic(np.repeat([-2.0, -1.0, 1.0, 2.0], [10, 40, 40, 10])), 0.2)
+    assert dip_statistic(np.ones(20)) == 0.0
+    d = dip_test(np.repeat([-2.0, -1.0, 1.0, 2.0], [2500, 10000, 10000, 2500]), n_sim=100)
+    assert np.isclose(d["dip"], 0.2) and d["p_value"] < 0.02
+
+def test_dip_test_separates_uni_and_bimodal():
+    rng = np.random.default_rng(1)
+    uni = dip_test(rng.normal(size=2000), n_sim=200)
+    bi = dip_test(np.r_[rng.normal(size=1000), rng.normal(5, 1, 1000)], n_sim=200)
+    assert uni["p_value"] > 0.05 and bi["p_value"] < 0.01
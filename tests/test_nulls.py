@@ -0,0 +1,45 @@
+import numpy as np
+from mpfst.nulls.phase_randomize import phase_randomize
+from mpfst.nulls.ensemble import surrogate_ensemble, surrogate_seeds, surrogate_test
+
+def _x(n=512):
+    return np.cumsum(np.random.default_rng(0).standard_normal(n))
+
+def test_phase_ensemble_matches_single_surrogates():
+    x = _x(301)
+    Y = np.concatenate([b for _, b in surrogate_ensemble(x, 7, seed=3, chunk=3)])
+    for y, s in zip(Y, surrogate_seeds(3, 7)):
+        assert np.allclose(y, phase_randomize(x, seed=s))
+
+def test_amplitude_adjusted_surrogates_keep_values():
+    x = _x()
+    for method in ("aaft", "iaaft"):
+        Y = np.concatenate([b for _, b in surrogate_ensemble(x, 4, method=method, seed=1, chunk=3)])
+        assert np.allclose(np.sort(Y, axis=1), np.sort(x))
+
+def test_surrogate_test_reproducible_across_chunking():
+    x = np.sin(np.linspace(0, 40*np.pi, 1024)) + 0.1*np.random.default_rng(2).standard_normal(1024)
+    r1 = surrogate_test(x, np.std, n_surrogates=40, seed=7, chunk=16)
+    r2 = surrogate_test(x, np.std, n_surrogates=40, seed=7, chunk=40)
+    assert np.array_equal(r1["null"], r2["null"]) and r1["null"].shape == (40,)
+    assert 0 < r1["p_value"] <= 1
+
+def test_block_surrogates_compat_and_index_map():
+    from mpfst.nulls.time_shuffle import time_shuffle, block_surrogates, BLOCK_METHODS
+    x = _x(1003)
+    def legacy(x, block, seed):  # list-of-slices implementation time_shuffle replaced
+        rng = np.random.default_rng(seed)
+        blocks = [x[i:i+block] for i in range(0, len(x), block)]
+        rng.shuffle(blocks)
+        return np.concatenate(blocks)
+    for block in (1, 64, 100, 2000):
+        assert np.array_equal(time_shuffle(x, block, seed=4), legacy(x, block, 4))
+    out = np.zeros((3, len(x)))
+    B = block_surrogates(x, 3, 100, seed=9, out=out)
+    assert B is out
+    for row, s in zip(B, np.random.SeedSequence(9).spawn(3)):
+        assert np.array_equal(row, legacy(x, 100, s))
+    for method in BLOCK_METHODS:
+        idx = block_surrogates(x, 2, 50, seed=1, method=method, indices_only=True)
+        assert idx.shape == (2, len(x)) and idx.min() >= 0 and idx.max() < len(x)
+        assert np.array_equal(x[idx], block_surrogates(x, 2, 50, seed=1, method=method))
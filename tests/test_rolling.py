@@ -0,0 +1,18 @@
+import numpy as np
+from mpfst.coherence.metrics import spectral_slope_gamma, hurst_dfa, heavy_tail_mu_hill
+from mpfst.coherence.meter import compute_m_l
+from mpfst.coherence.rolling import rolling_coherence
+
+def test_rolling_matches_window_loop():
+    rng = np.random.default_rng(0)
+    fs, win, hop = 100.0, 2000, 700
+    x = np.cumsum(rng.standard_normal(9000))*0.05 + rng.standard_t(3, 9000)
+    r = rolling_coherence(x, fs, win, hop, fmin=0.1, fmax=20.0, max_scale=500, batch=4)
+    starts = range(0, len(x)-win+1, hop)
+    assert len(r["m_l"]) == len(starts)
+    for i, s in enumerate(starts):
+        seg = x[s:s+win]
+        mu, ga, H = heavy_tail_mu_hill(seg), spectral_slope_gamma(seg, fs, 0.1, 20.0), hurst_dfa(seg, max_scale=500)
+        assert np.allclose([r["mu"][i], r["gamma"][i], r["H"][i]], [mu, ga, H])
+        assert np.isclose(r["m_l"][i], compute_m_l(mu, ga, H))
+        assert np.isclose(r["t"][i], (s + win/2)/fs)
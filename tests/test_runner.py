@@ -0,0 +1,44 @@
+import json, pickle
+import numpy as np
+from mpfst.io import Signal, write_signal
+from mpfst.runner import plan, run
+
+def _manifest(tmp_path):
+    x = np.random.default_rng(0).standard_normal(512)
+    write_signal(Signal(x, 64.0), tmp_path/"sig.npz")
+    return {"studies": {"toy": {"input": str(tmp_path/"sig.npz"), "ssm": {"bands": 4},
+                                "nulls": ["phase_randomize", "time_shuffle"],
+                                "n_surrogates": 6, "batch": 3, "block": 32}}}
+
+def test_plan_expands_null_batches():
+    dag = plan("s", {"input": "x.csv", "nulls": ["phase_randomize"], "n_surrogates": 10, "batch": 4})
+    assert [k for k in dag if k.startswith("nulls/")] == ["nulls/phase_randomize/0", "nulls/phase_randomize/4",
+                                                          "nulls/phase_randomize/8"]
+    assert set(dag["stats"]) == {"metrics", "ssm", *[k for k in dag if k.startswith("nulls/")]}
+
+def test_run_and_resume(tmp_path):
+    m, out = _manifest(tmp_path), tmp_path/"runs"
+    rep = run(m, out, workers=2)
+    assert {r["status"] for r in rep["stages"]} == {"done"}
+    tests = rep["results"]["toy"]["stats"]["tests"]
+    assert len(tests) == 4 and all(0 < t["p_value"] <= 1 and t["n"] == 6 for t in tests)
+    assert json.loads((out/"report.json").read_text())["stages"][0]["study"] == "toy"
+    # drop one checkpoint: only that stage reruns; its output is unchanged, so stats stays cached
+    next((out/"toy").glob("nulls_time_shuffle_3-*.pkl")).unlink()
+    rep2 = run(m, out, workers=2)
+    status = {r["stage"]: r["status"] for r in rep2["stages"]}
+    assert status.pop("nulls/time_shuffle/3") == "done"
+    assert set(status.values()) == {"cached"}
+    assert rep2["results"]["toy"]["stats"]["tests"] == tests
+    # a changed upstream result invalidates everything that reads it
+    ck = next((out/"toy").glob("nulls_time_shuffle_3-*.pkl"))
+    null = pickle.loads(ck.read_bytes()); null["n_jumps"] = null["n_jumps"] + 100
+    ck.write_bytes(pickle.dumps(null))
+    status = {r["stage"]: r["status"] for r in run(m, out, workers=2)["stages"]}
+    assert status.pop("stats") == "done" and set(status.values()) == {"cached"}
+
+def test_entrypoint_without_args_is_reported(tmp_path):
+    m = {"studies": {"gate": {"entrypoint": "mpfst.gating.linear_response:gw_vbk_cli"}}}
+    rep = run(m, tmp_path, workers=1)
+    assert rep["stages"] == [{"study": "gate", "stage": "entrypoint", "status": "skipped", "reason": "no args in manifest"}]
+    assert "| gate | entrypoint | skipped |" in (tmp_path/"report.md").read_text()
@@ -12,3 +12,43 @@ def test_ssm_detects_jump():
     dom = dominant_shell_indices(E, energy_min=np.percentile(E, 80))
     jumps = detect_shell_jumps(dom, edges, min_gap=10)
     assert any(abs(d[-1]-1.0)<0.2 for d in jumps), f"No octave jump found: {jumps}"
+
+def test_fft_filterbank_matches_masked_hilbert():
+    from scipy.signal import hilbert
+    from mpfst.spectral.utils import fft_band_masks
+    fs = 1000.0
+    edges = octave_band_edges(8, 128, 5)
+    for n in (2000, 2001):
+        x = np.random.default_rng(n).standard_normal(n)
+        E = filterbank_energy(x, fs, edges, backend="fft", rolloff=0.2)
+        M = fft_band_masks(np.fft.rfftfreq(n, 1/fs), edges, rolloff=0.2)
+        ref = [np.abs(hilbert(np.fft.irfft(m*np.fft.rfft(x), n)))**2 for m in M]
+        assert np.allclose(E, ref, atol=1e-12)
+
+def test_ssm_detects_jump_fft_backend():
+    from mpfst.spectral.octave_jump import detect_shell_jumps_series
+    fs = 1000.0
+    t = np.arange(0, 2.0, 1/fs)
+    x = np.sin(2*np.pi*20*t*(t<1.0)) + np.sin(2*np.pi*40*t*(t>=1.0))
+    out = detect_shell_jumps_series(x, fs, 8, 128, n_bands=5, min_gap=10, backend="fft")
+    assert any(abs(d[-1]-1.0)<0.2 and abs(d[0]-1000)<50 for d in out["jumps"]), out["jumps"]
+
+def test_framed_mode_matches_full_and_keeps_sample_times():
+    from mpfst.spectral.octave_jump import detect_shell_jumps_series
+    fs = 1000.0
+    t = np.arange(0, 4.0, 1/fs)
+    x = np.sin(2*np.pi*20*t)*(t<1) + np.sin(2*np.pi*40*t)*((t>=1)&(t<2.5)) + np.sin(2*np.pi*80*t)*(t>=2.5)
+    full = detect_shell_jumps_series(x, fs, 8, 256, n_bands=5, min_gap=10)
+    assert detect_shell_jumps_series(x, fs, 8, 256, n_bands=5, min_gap=10, frame=1) == full
+    framed = detect_shell_jumps_series(x, fs, 8, 256, n_bands=5, min_gap=200, backend="fft",
+                                       frame=0.05, hop=0.025, frame_unit="seconds", dtype=np.float32)
+    assert [j[1:3] for j in framed["jumps"]] == [(1, 2), (2, 3)]
+    assert all(abs(a[0]-b[0]) < 50 for a, b in zip(framed["jumps"], full["jumps"]))
+
+def test_frame_means_keep_precision_after_a_burst():
+    from mpfst.spectral.utils import _frame_means, frame_starts
+    v = np.full(4000, 1e-6); v[:100] = 1e12     # huge burst, then a tiny background
+    for frame, hop in ((100, 100), (100, 40), (50, 120)):
+        s = frame_starts(len(v), frame, hop)
+        ref = np.array([v[i:i+frame].mean() for i in s])
+        assert np.allclose(_frame_means(v, frame, hop), ref, rtol=1e-12, atol=0)
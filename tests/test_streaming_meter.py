@@ -0,0 +1,18 @@
+import numpy as np
+from mpfst.coherence.streaming import CoherenceMeter
+from mpfst.coherence.rolling import rolling_coherence
+
+def test_meter_tracks_batch_and_ignores_chunking():
+    rng = np.random.default_rng(0)
+    fs, win, hop = 100.0, 3000, 500
+    x = np.cumsum(rng.standard_normal(12000))*0.05 + rng.standard_t(3, 12000)
+    a = CoherenceMeter(fs, win, hop, fmin=0.1, fmax=20.0, max_scale=512)
+    b = CoherenceMeter(fs, win, hop, fmin=0.1, fmax=20.0, max_scale=512)
+    ml_a = a.update(x)
+    ml_b = np.concatenate([b.update(c) for c in np.array_split(x, 97)])
+    assert np.allclose(ml_a, ml_b)
+    r = rolling_coherence(x, fs, win, hop, fmin=0.1, fmax=20.0, max_scale=512)
+    assert len(ml_a) == len(r["m_l"])
+    assert np.max(np.abs(ml_a - r["m_l"])) < 0.05
+    v = a.value()
+    assert abs(v["H"] - r["H"][-1]) < 0.05 and abs(v["mu"] - r["mu"][-1]) < 0.2
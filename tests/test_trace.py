@@ -0,0 +1,54 @@
+import json, os, subprocess, sys
+import numpy as np
+import pytest
+from mpfst import trace
+from mpfst.coherence.metrics import spectral_slope_gamma, hurst_dfa
+from mpfst.spectral.utils import octave_band_edges, filterbank_energy
+from mpfst.nulls.ensemble import surrogate_test
+
+@pytest.fixture
+def tr():
+    trace.reset()
+    yield trace
+    trace.disable(); trace.reset()
+
+def test_disabled_records_nothing(tr):
+    x = np.random.default_rng(0).standard_normal(4096)
+    g = spectral_slope_gamma(x, fs=128.0)
+    assert trace.summary() == [] and trace.span("x") is trace.span("y")
+    with trace.tracing():
+        assert spectral_slope_gamma(x, fs=128.0) == g
+
+def test_summary_only_tracing_keeps_no_events(tr):
+    x = np.random.default_rng(0).standard_normal(2048)
+    with trace.tracing():
+        for _ in range(50): hurst_dfa(x + _)
+    assert len(trace._events) == 0
+    assert {r["name"]: r for r in trace.summary()}["coherence.dfa.dfa"]["calls"] == 50
+    assert trace._events.maxlen is not None
+
+def test_spans_nesting_and_chrome_export(tr, tmp_path):
+    x = np.random.default_rng(0).standard_normal(8192)
+    with trace.tracing(tmp_path/"t.json", memory=True):
+        filterbank_energy(x, 256.0, octave_band_edges(4, 64, 4), backend="butter")
+        hurst_dfa(x)
+        surrogate_test(x, np.std, n_surrogates=20, seed=0)
+    rows = {r["name"]: r for r in trace.summary()}
+    fb = rows["spectral.utils.filterbank_energy"]
+    assert fb["calls"] == 1 and fb["elements"] >= x.size and fb["self_s"] < fb["total_s"]
+    assert rows["spectral.utils.band_envelope"]["calls"] == 4 and rows["scipy.filtfilt"]["calls"] == 4
+    assert rows["coherence.dfa.dfa"]["calls"] == 1 and rows["nulls.surrogates"]["count"] == 20
+    assert fb["alloc_bytes"] > 0   # the returned (bands, time) matrix
+    ev = json.loads((tmp_path/"t.json").read_text())["traceEvents"]
+    assert {"X", "C"} <= {e["ph"] for e in ev}
+    assert "spectral.utils.filterbank_energy" in trace.format_summary()
+    assert not trace.enabled()
+
+def test_env_var_writes_trace_at_exit(tmp_path):
+    out = tmp_path/"env.json"
+    code = "import numpy as np; from mpfst.coherence.metrics import hurst_dfa; hurst_dfa(np.arange(2048.0)**0.5)"
+    p = subprocess.run([sys.executable, "-c", code], env={**os.environ, "MPFST_TRACE": str(out)},
+                       capture_output=True, text=True, check=True)
+    assert "coherence.metrics.hurst_dfa" in p.stderr
+    names = {e["name"] for e in json.loads(out.read_text())["traceEvents"]}
+    assert {"coherence.metrics.hurst_dfa", "coherence.dfa.dfa"} <= names